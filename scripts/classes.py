@@ -2,7 +2,11 @@
 ### PACKAGES ###
 ################
 
-from typing import Dict, List, Optional, Set, Tuple, Union
+from typing import Dict, FrozenSet, List, Optional, Set, Tuple, Union
+from bisect import bisect_left
+from itertools import accumulate, combinations, groupby
+from operator import attrgetter, itemgetter
+import heapq
 import random
 import math
 
@@ -47,6 +51,18 @@ XG_BASELINES = {
     (6, 5): (0.163, 0.117),
 }
 
+# 5v5 fallbacks for manpower situations missing from the tables above
+SHOT_RATE_5V5 = SHOT_RATE_BASELINES[(5, 5)]
+XG_5V5 = XG_BASELINES[(5, 5)]
+
+# Flat lookup tables over every (a, b) with 3 <= a, b <= 6, indexed by (a - 3) * 4 + (b - 3);
+# gaps (6v6) are prefilled with the 5v5 fallback so lookups need no membership test
+SHOT_RATE_LUT = tuple(SHOT_RATE_BASELINES.get((a, b), SHOT_RATE_5V5) for a in range(3, 7) for b in range(3, 7))
+XG_LUT = tuple(XG_BASELINES.get((a, b), XG_5V5) for a in range(3, 7) for b in range(3, 7))
+
+# Period length in seconds (regulation and each sudden-death overtime period)
+PERIOD_SECONDS = 1200.0  # 20 minutes
+
 # Home-ice advantage multipliers
 # Penalty rate: boost home team's penalty draw rate (e.g., +5-10%)
 # Note: Shot creation, xG bonus, and suppression are now team-specific (see Team.hfa_* attributes)
@@ -64,6 +80,8 @@ PEN_BETA = 0.40
 PEN_NORM = math.exp(0.5 * PEN_BETA * PEN_BETA)
 PEN_CLAMP_LO = 0.5
 PEN_CLAMP_HI = 1.8
+# Weighting used to pick which on-ice skater takes a penalty
+PEN_SELECT_BETA = 0.55  # exp(+/- 2*beta) ≈ 3x odds across 2 SDs
 
 # Assist distributions by manpower situation
 # Format: (a, b) -> ({prob_0_assists, prob_1_assist, prob_2_assists} for team with a skaters,
@@ -86,6 +104,21 @@ ASSIST_DISTRIBUTIONS = {
     (6, 5): ([0.07, 0.20, 0.73], [0.45, 0.37, 0.18]),
 }
 
+# Scoring-team cutoffs (P(0), P(0) + P(1)) for every clamped situation, summed once at import and
+# laid out like SHOT_RATE_LUT; situations missing above (6v6) use the 5v5 distribution
+_ASSIST_CUTOFFS = tuple(
+    (probs[0], probs[0] + probs[1])
+    for a in range(3, 7) for b in range(3, 7)
+    for probs in (ASSIST_DISTRIBUTIONS.get((a, b), ASSIST_DISTRIBUTIONS[(5, 5)])[0],)
+)
+
+# Valid keys for League.player_rankings
+RANKING_KEYS = frozenset({'creation', 'conversion', 'suppression', 'prevention', 'goalkeeping', 'stamina', 'discipline', 'total'})
+
+def _ranking_total(p: 'Player') -> float:
+    """Sum of a player's skill attributes used for 'total' rankings."""
+    return p.total + p.goalkeeping
+
 def sample_assists(n_scoring_team: int, n_opposing_team: int) -> int:
     """Sample number of assists (0, 1, or 2) for a goal based on manpower situation.
     
@@ -97,26 +130,51 @@ def sample_assists(n_scoring_team: int, n_opposing_team: int) -> int:
         Number of assists: 0, 1, or 2
     """
     # Clamp to valid range (3-6 skaters)
-    n_scoring_team = max(3, min(6, n_scoring_team))
-    n_opposing_team = max(3, min(6, n_opposing_team))
+    a = 3 if n_scoring_team < 3 else (6 if n_scoring_team > 6 else n_scoring_team)
+    b = 3 if n_opposing_team < 3 else (6 if n_opposing_team > 6 else n_opposing_team)
     
-    # Get distribution for scoring team
-    situation = (n_scoring_team, n_opposing_team)
-    if situation in ASSIST_DISTRIBUTIONS:
-        dist_for_scoring, dist_for_opposing = ASSIST_DISTRIBUTIONS[situation]
-        probs = dist_for_scoring
-    else:
-        # Fallback to 5v5 distribution
-        probs = ASSIST_DISTRIBUTIONS[(5, 5)][0]
-    
-    # Sample from distribution
+    # Sample from the scoring team's precomputed cutoffs
+    c0, c1 = _ASSIST_CUTOFFS[(a - 3) * 4 + (b - 3)]
     r = random.random()
-    if r < probs[0]:
-        return 0
-    elif r < probs[0] + probs[1]:
-        return 1
-    else:
-        return 2
+    return 0 if r < c0 else (1 if r < c1 else 2)
+
+
+# Standings columns, in the order they are accumulated and reported
+STANDINGS_COLUMNS = ('GP', 'W', 'OTW', 'L', 'OTL', 'PTS', 'GF', 'GA')
+
+def _accumulate_standings(stats: List[List[int]], team_idx: Dict[str, int], game_rows) -> None:
+    """Apply game rows in place to per-team [GP, W, OTW, L, OTL, PTS, GF, GA] rows."""
+    for row in game_rows:
+        h = stats[team_idx[row['home_team']]]
+        a = stats[team_idx[row['away_team']]]
+        hs = row['home_score']; as_ = row['away_score']
+        h[0] += 1; a[0] += 1
+        h[6] += hs; h[7] += as_
+        a[6] += as_; a[7] += hs
+        winner, loser = (h, a) if hs > as_ else (a, h)
+        winner[5] += 2
+        if row['went_ot']:
+            winner[2] += 1
+            loser[4] += 1; loser[5] += 1
+        else:
+            winner[1] += 1
+            loser[3] += 1
+
+# Standings order: points, then goal differential, then goals for (all descending)
+_STANDINGS_SORT_KEY = itemgetter('PTS', 'GD', 'GF')
+
+def _standings_snapshot(teams: List[str], stats: List[List[int]]) -> List[Dict]:
+    """Build standings rows (with GD) from per-team stats, sorted by PTS, GD, GF."""
+    snap_rows: List[Dict] = []
+    for team_name, s in zip(teams, stats):
+        gp, w, otw, l, otl, pts, gf, ga = s
+        snap_rows.append({
+            'team': team_name,
+            'GP': gp, 'W': w, 'OTW': otw, 'L': l, 'OTL': otl,
+            'PTS': pts, 'GF': gf, 'GA': ga, 'GD': gf - ga
+        })
+    snap_rows.sort(key=_STANDINGS_SORT_KEY, reverse=True)
+    return snap_rows
 
 
 class Player:
@@ -132,7 +190,18 @@ class Player:
         goalkeeping: Ability to save shots (only for goalies, reduces xG).
         stamina: Measure of endurance.
         discipline: Measure of penalty discipline.
+        offense: creation + conversion, derived at construction (sort key).
+        defense: suppression + prevention, derived at construction (sort key).
+        total: creation + conversion + suppression + prevention, derived at construction (sort key).
+        is_goalie: position == "G", derived at construction.
+        is_defenseman: position == "D", derived at construction.
+        pen_weight: exp(-PEN_BETA * discipline), the on-ice penalty-rate weight.
+        pen_select_weight: exp(-PEN_SELECT_BETA * discipline), the odds of being the penalized skater.
     """
+    __slots__ = ('name', 'position', 'creation', 'conversion', 'suppression', 'prevention',
+                 'goalkeeping', 'stamina', 'discipline', 'offense', 'defense', 'total',
+                 'is_goalie', 'is_defenseman', 'pen_weight', 'pen_select_weight')
+
     def __init__(self, name: str, position: str, 
                  creation: float = 0.0, conversion: float = 0.0,
                  suppression: float = 0.0, prevention: float = 0.0,
@@ -147,9 +216,40 @@ class Player:
         self.goalkeeping = goalkeeping if position == "G" else 0.0
         self.stamina = stamina
         self.discipline = discipline
+        # Derived sort keys used by line building and special-teams selection
+        self.offense = creation + conversion
+        self.defense = suppression + prevention
+        self.total = creation + conversion + suppression + prevention
+        # Position flags, so lineup and penalty code tests a bool instead of comparing strings
+        self.is_goalie = position == "G"
+        self.is_defenseman = position == "D"
+        # Discipline is fixed for the season, so the penalty weights are computed once here
+        self.pen_weight = math.exp(-PEN_BETA * discipline)
+        self.pen_select_weight = math.exp(-PEN_SELECT_BETA * discipline)
+
+# C-level sort keys over the derived Player scores
+_OFFENSE_KEY = attrgetter('offense')
+_DEFENSE_KEY = attrgetter('defense')
+_TOTAL_KEY = attrgetter('total')
+def _chunk(players: List['Player'], group_size: int) -> Dict[int, List['Player']]:
+    """Split an ordered list into consecutive groups of group_size, numbered from 1."""
+    return {i + 1: players[i * group_size:(i + 1) * group_size]
+            for i in range((len(players) + group_size - 1) // group_size)}
+
+# Key for special-teams units when no one is unavailable
+_NO_PLAYERS: FrozenSet['Player'] = frozenset()
+
+def _first_available(ranked: List['Player'], position: str, taken: Set['Player']) -> Optional['Player']:
+    """Return the best-ranked player at `position` not in `taken`, or None."""
+    for p in ranked:
+        if p.position == position and p not in taken:
+            return p
+    return None
 
 class Coach:
     """Represents a hockey coach with a specific playstyle."""
+    __slots__ = ('name', 'playstyle')
+
     def __init__(self, name: str, playstyle: str):
         self.name = name
         self.playstyle = playstyle  # "star-centric", "balanced", "complementary", "hyper-offensive", "hyper-defensive"
@@ -177,12 +277,8 @@ class Coach:
     
     def _star_centric_groupings(self, players: List[Player], group_size: int) -> Dict[int, List[Player]]:
         """Best players by sum of all attributes go to top groupings."""
-        sorted_players = sorted(players, key=lambda p: p.creation + p.conversion + p.suppression + p.prevention, reverse=True)
-        groupings = {}
-        for i in range(0, len(sorted_players), group_size):
-            line_num = (i // group_size) + 1
-            groupings[line_num] = sorted_players[i:i + group_size]
-        return groupings
+        sorted_players = sorted(players, key=_TOTAL_KEY, reverse=True)
+        return _chunk(sorted_players, group_size)
     
     def _balanced_groupings(self, players: List[Player], group_size: int) -> Dict[int, List[Player]]:
         """Make groupings as equal as possible in talent.
@@ -190,59 +286,52 @@ class Coach:
         Create exactly N = floor(len(players)/group_size) groups of size group_size
         using round-robin assignment to balance totals, avoiding 3x4 errors.
         """
-        sorted_players = sorted(players, key=lambda p: p.creation + p.conversion + p.suppression + p.prevention, reverse=True)
+        sorted_players = sorted(players, key=_TOTAL_KEY, reverse=True)
         num_groups = max(1, len(sorted_players) // group_size)
-        groups: List[List[Player]] = [[] for _ in range(num_groups)]
-        # Round-robin best-available into groups to balance sums
-        for idx, p in enumerate(sorted_players[: num_groups * group_size]):
-            groups[idx % num_groups].append(p)
-        return {i + 1: grp for i, grp in enumerate(groups)}
+        # Round-robin best-available into groups to balance sums: group g takes every
+        # num_groups-th player starting at g, which a strided slice copies in one step
+        pool = sorted_players[: num_groups * group_size]
+        return {g + 1: pool[g::num_groups] for g in range(num_groups)}
     
     def _complementary_groupings(self, players: List[Player], group_size: int) -> Dict[int, List[Player]]:
         """Groupings contain a mix of offensive and defensive players."""
         # Offensive = players with high creation+conversion
         # Defensive = players with high suppression+prevention
-        offensive_score = lambda p: p.creation + p.conversion
-        defensive_score = lambda p: p.suppression + p.prevention
-        offensive = sorted([p for p in players if offensive_score(p) > defensive_score(p)], key=offensive_score, reverse=True)
-        defensive = sorted([p for p in players if defensive_score(p) >= offensive_score(p)], key=defensive_score, reverse=True)
+        offensive = sorted([p for p in players if p.offense > p.defense], key=_OFFENSE_KEY, reverse=True)
+        defensive = sorted([p for p in players if p.defense >= p.offense], key=_DEFENSE_KEY, reverse=True)
         num_groups = max(1, len(players) // group_size)
         groups: List[List[Player]] = [[] for _ in range(num_groups)]
-        # Build alternating pools of size group_size per group
+        # Build alternating pools of size group_size per group, walking each pool with a cursor
+        n_off, n_def = len(offensive), len(defensive)
+        oi = di = 0
         idx = 0
-        while any([offensive, defensive]) and idx < num_groups * group_size:
-            g = idx % num_groups
-            # Alternate offense/defense per slot within group
-            slot = len(groups[g])
-            if slot % 2 == 0:
-                pick = offensive.pop(0) if offensive else (defensive.pop(0) if defensive else None)
+        while (oi < n_off or di < n_def) and idx < num_groups * group_size:
+            group = groups[idx % num_groups]
+            # Alternate offense/defense per slot within group, falling back to whichever pool remains
+            if len(group) % 2 == 0:
+                take_offensive = oi < n_off
             else:
-                pick = defensive.pop(0) if defensive else (offensive.pop(0) if offensive else None)
-            if pick is None:
-                break
-            groups[g].append(pick)
+                take_offensive = di >= n_def
+            if take_offensive:
+                group.append(offensive[oi])
+                oi += 1
+            else:
+                group.append(defensive[di])
+                di += 1
             idx += 1
-        # Trim to exact group_size
-        groups = [grp[:group_size] for grp in groups]
+        # Slot idx goes to group idx % num_groups and idx stops at num_groups * group_size,
+        # so no group can exceed group_size
         return {i + 1: grp for i, grp in enumerate(groups)}
     
     def _hyper_offensive_groupings(self, players: List[Player], group_size: int) -> Dict[int, List[Player]]:
         """Greedy search for best offensive attributes (creation+conversion), stack groupings accordingly."""
-        sorted_players = sorted(players, key=lambda p: p.creation + p.conversion, reverse=True)
-        groupings = {}
-        for i in range(0, len(sorted_players), group_size):
-            line_num = (i // group_size) + 1
-            groupings[line_num] = sorted_players[i:i + group_size]
-        return groupings
+        sorted_players = sorted(players, key=_OFFENSE_KEY, reverse=True)
+        return _chunk(sorted_players, group_size)
     
     def _hyper_defensive_groupings(self, players: List[Player], group_size: int) -> Dict[int, List[Player]]:
         """Greedy search for best defensive attributes (suppression+prevention), stack groupings accordingly."""
-        sorted_players = sorted(players, key=lambda p: p.suppression + p.prevention, reverse=True)
-        groupings = {}
-        for i in range(0, len(sorted_players), group_size):
-            line_num = (i // group_size) + 1
-            groupings[line_num] = sorted_players[i:i + group_size]
-        return groupings
+        sorted_players = sorted(players, key=_DEFENSE_KEY, reverse=True)
+        return _chunk(sorted_players, group_size)
 
 class Team:
     """A team composed of players with helpers to access positions.
@@ -258,6 +347,11 @@ class Team:
         lines: Forward lines created by coach.
         pairs: Defensive pairings created by coach.
     """
+    __slots__ = ('name', 'roster', 'hfa_shot_creation_mult', 'hfa_xg_bonus',
+                 'hfa_shot_suppression_mult', 'hfa_xg_suppression', 'coach', 'lines', 'pairs',
+                 '_F', '_D', '_G', '_skaters', '_by_offense', '_by_defense', '_pp_units', '_pk_units',
+                 '_line_pairs', '_line_pair_names', '_line_pair_summaries', '_roster_sums')
+
     def __init__(self, name: str, roster: List[Player], 
                  hfa_shot_creation_mult: float, hfa_xg_bonus: float,
                  hfa_shot_suppression_mult: float, hfa_xg_suppression: float,
@@ -269,21 +363,104 @@ class Team:
         self.hfa_shot_suppression_mult = hfa_shot_suppression_mult
         self.hfa_xg_suppression = hfa_xg_suppression
         self.coach = coach
+        # Position buckets (roster order), kept in sync by add_player/remove_player
+        self._F: List[Player] = [p for p in self.roster if p.position == "F"]
+        self._D: List[Player] = [p for p in self.roster if p.position == "D"]
+        self._G: List[Player] = [p for p in self.roster if p.position == "G"]
+        self._skaters: List[Player] = [p for p in self.roster if not p.is_goalie]
+        self._rank_skaters()
         self.lines = coach.create_lines(self.forwards())
         self.pairs = coach.create_pairs(self.defensemen())
+        self._line_pairs: Dict[Tuple[int, int], Tuple[Player, ...]] = {}
+        self._line_pair_names: Dict[Tuple[int, int], Tuple[str, ...]] = {}
+        self._line_pair_summaries: Dict[Tuple[int, int], Tuple[float, ...]] = {}
+        self._roster_sums: Optional[Tuple[float, ...]] = None
+
+    def _rank_skaters(self) -> None:
+        """Cache skaters ranked by offense and by defense, best first, for special-teams selection.
+
+        Ratings are fixed, so the rankings only change with the roster. The sorts are stable,
+        so filtering a ranking by availability matches sorting the available skaters directly.
+        """
+        self._by_offense: List[Player] = sorted(self._skaters, key=_OFFENSE_KEY, reverse=True)
+        self._by_defense: List[Player] = sorted(self._skaters, key=_DEFENSE_KEY, reverse=True)
+        # Special-teams units are derived from the rankings, so they are dropped with them
+        self._pp_units: Dict[FrozenSet[Player], List[Player]] = {}
+        self._pk_units: Dict[FrozenSet[Player], List[Player]] = {}
+
+    def line_pair(self, line_id: int, pair_id: int) -> Tuple[Player, ...]:
+        """Skaters of forward line `line_id` followed by defensive pair `pair_id`.
+
+        Lines and pairs are fixed once built, so each combination is concatenated once and cached.
+        """
+        unit = self._line_pairs.get((line_id, pair_id))
+        if unit is None:
+            unit = self._line_pairs[(line_id, pair_id)] = tuple(self.lines[line_id] + self.pairs[pair_id])
+        return unit
+
+    def line_pair_names(self, line_id: int, pair_id: int) -> Tuple[str, ...]:
+        """Names of line_pair(line_id, pair_id), in the same order, computed once per combination."""
+        names = self._line_pair_names.get((line_id, pair_id))
+        if names is None:
+            names = self._line_pair_names[(line_id, pair_id)] = tuple(p.name for p in self.line_pair(line_id, pair_id))
+        return names
 
+    def line_pair_summary(self, line_id: int, pair_id: int) -> Tuple[float, float, float, float, float, float]:
+        """_on_ice_summary of line_pair(line_id, pair_id), computed once per combination.
+
+        The unit has no goalie, so the goalkeeping entry is 0.0; callers substitute their goalie's.
+        """
+        summary = self._line_pair_summaries.get((line_id, pair_id))
+        if summary is None:
+            summary = self._line_pair_summaries[(line_id, pair_id)] = _on_ice_summary(self.line_pair(line_id, pair_id))
+        return summary
+
+    def roster_sums(self) -> Tuple[float, float, float, float, float, float, float]:
+        """Roster totals of (creation, conversion, suppression, prevention, goalkeeping, stamina, discipline).
+
+        Summed once in roster order and cached; add_player/remove_player clear the cache.
+        """
+        if self._roster_sums is None:
+            creation_sum = conversion_sum = suppression_sum = prevention_sum = goalkeeping_sum = sta = dis = 0.0
+            for p in self.roster:
+                creation_sum += p.creation
+                conversion_sum += p.conversion
+                suppression_sum += p.suppression
+                prevention_sum += p.prevention
+                goalkeeping_sum += p.goalkeeping
+                sta += p.stamina
+                dis += p.discipline
+            self._roster_sums = (creation_sum, conversion_sum, suppression_sum, prevention_sum,
+                                 goalkeeping_sum, sta, dis)
+        return self._roster_sums
+
+    # Position accessors return the cached buckets; callers must not mutate them.
     def forwards(self) -> List[Player]:
-        return [p for p in self.roster if p.position == "F"]
+        return self._F
     def defensemen(self) -> List[Player]:
-        return [p for p in self.roster if p.position == "D"]
+        return self._D
     def goalies(self) -> List[Player]:
-        return [p for p in self.roster if p.position == "G"]
+        return self._G
 
     def add_player(self, player: Player) -> None:
         self.roster.append(player)
+        bucket = {"F": self._F, "D": self._D, "G": self._G}.get(player.position)
+        if bucket is not None:
+            bucket.append(player)
+        if not player.is_goalie:
+            self._skaters.append(player)
+            self._rank_skaters()
+        self._roster_sums = None
 
     def remove_player(self, player: Player) -> None:
         self.roster.remove(player)
+        bucket = {"F": self._F, "D": self._D, "G": self._G}.get(player.position)
+        if bucket is not None:
+            bucket.remove(player)
+        if not player.is_goalie:
+            self._skaters.remove(player)
+            self._rank_skaters()
+        self._roster_sums = None
 
     def power_play_unit(self, unavailable: Optional[Set[Player]] = None) -> List[Player]:
         """Select a 5-skater power play unit from available players.
@@ -295,57 +472,69 @@ class Team:
 
         If constraints cannot be perfectly satisfied due to roster makeup, the method
         returns the best feasible selection given availability.
+
+        Units are memoized per unavailable set; callers must not mutate the returned list.
         """
-        unavailable = unavailable or set()
-        all_skaters = [p for p in self.roster if p.position != "G"]
-        skaters = [p for p in all_skaters if p not in unavailable]
-        if not skaters:
+        key = frozenset(unavailable) if unavailable else _NO_PLAYERS
+        unit = self._pp_units.get(key)
+        if unit is None:
+            unit = self._pp_units[key] = self._select_power_play_unit(unavailable)
+        return unit
+
+    def _select_power_play_unit(self, unavailable: Optional[Set[Player]]) -> List[Player]:
+        """Uncached power_play_unit selection."""
+        ranked = self._by_offense
+        # Filtering the cached ranking keeps it sorted; players hash by identity, so set
+        # membership needs no __eq__ dispatch
+        skaters_sorted_off = [p for p in ranked if p not in unavailable] if unavailable else ranked
+        if not skaters_sorted_off:
             return []
 
         # Determine target size based on number unavailable among skaters
-        num_unavailable = sum(1 for p in all_skaters if p in unavailable)
+        num_unavailable = len(ranked) - len(skaters_sorted_off)
         target_size = max(0, 5 - num_unavailable)
         if target_size == 0:
             return []
 
-        offensive_score = lambda p: p.creation + p.conversion
-        skaters_sorted_off = sorted(skaters, key=offensive_score, reverse=True)
-        selected: List[Player] = skaters_sorted_off[:target_size]
-
+        offensive_score = _OFFENSE_KEY
         # If fewer than target_size skaters are available, return what we have while trying
         # to satisfy constraints below where possible.
-        max_size = min(target_size, len(skaters_sorted_off))
-        selected = selected[:max_size]
-
-        def is_def(player: Player) -> bool:
-            return player.position == "D"
+        selected: List[Player] = skaters_sorted_off[:target_size]
+        # Set mirror of `selected` for O(1) membership checks during swaps and fills
+        selected_set = set(selected)
+        # `selected` stays in ranking order until a swap or fill appends out of order
+        reordered = False
 
-        def_count = sum(1 for p in selected if is_def(p))
+        def_count = sum(1 for p in selected if p.is_defenseman)
 
         # Ensure at least 1 defenseman if any D are available overall.
         if def_count == 0:
-            available_ds = [p for p in skaters_sorted_off if is_def(p) and p not in selected]
-            if available_ds:
+            best_d = _first_available(skaters_sorted_off, "D", selected_set)
+            if best_d is not None:
                 # Replace the lowest-offense forward with the best available D
                 forwards_in_selected = [p for p in selected if p.position == "F"]
                 if forwards_in_selected:
                     lowest_fwd = min(forwards_in_selected, key=offensive_score)
-                    best_d = available_ds[0]
                     # swap
                     selected.remove(lowest_fwd)
                     selected.append(best_d)
+                    reordered = True
+                    selected_set.discard(lowest_fwd)
+                    selected_set.add(best_d)
                     def_count = 1
 
         # Cap defensemen at 2 by replacing lowest-offense D with best available F
         while def_count > 2:
-            ds_in_selected = sorted([p for p in selected if is_def(p)], key=offensive_score)
-            forwards_available = [p for p in skaters_sorted_off if p.position == "F" and p not in selected]
-            if not ds_in_selected or not forwards_available:
+            ds_in_selected = [p for p in selected if p.is_defenseman]
+            best_f = _first_available(skaters_sorted_off, "F", selected_set)
+            if not ds_in_selected or best_f is None:
                 break
-            lowest_d = ds_in_selected[0]
-            best_f = forwards_available[0]
+            lowest_d = min(ds_in_selected, key=offensive_score)
             selected.remove(lowest_d)
             selected.append(best_f)
+            reordered = True
+            selected_set.discard(lowest_d)
+            selected_set.add(best_f)
             def_count -= 1
 
         # If still no D (e.g., roster has 0 Ds), we accept the forward-only selection.
@@ -354,18 +543,20 @@ class Team:
         # while respecting max 2 defensemen.
         if len(selected) < target_size:
             for candidate in skaters_sorted_off:
-                if candidate in selected:
+                if candidate in selected_set:
                     continue
-                if candidate.position == "D" and def_count >= 2:
+                if candidate.is_defenseman and def_count >= 2:
                     continue
                 selected.append(candidate)
-                if candidate.position == "D":
+                reordered = True
+                selected_set.add(candidate)
+                if candidate.is_defenseman:
                     def_count += 1
                 if len(selected) == target_size:
                     break
 
         # Return sorted by offensive score for readability/consistency
-        return sorted(selected, key=offensive_score, reverse=True)
+        return sorted(selected, key=offensive_score, reverse=True) if reordered else selected
 
     def penalty_kill_unit(self, unavailable: Optional[Set[Player]] = None, num_skaters: int = 4) -> List[Player]:
         """Select a penalty kill unit with defensive constraints.
@@ -376,83 +567,104 @@ class Team:
           (e.g., 4 when one penalized, 3 when two)
         - Enforce: at least 2 defensemen (if possible) and at most 3 defensemen
         - Goalies are excluded
+
+        The unit size follows from `unavailable` alone (num_skaters is accepted for callers but
+        not used), so units are memoized per unavailable set; callers must not mutate the result.
         """
-        unavailable = unavailable or set()
-        all_skaters = [p for p in self.roster if p.position != "G"]
-        skaters = [p for p in all_skaters if p not in unavailable]
-        if not skaters:
+        key = frozenset(unavailable) if unavailable else _NO_PLAYERS
+        unit = self._pk_units.get(key)
+        if unit is None:
+            unit = self._pk_units[key] = self._select_penalty_kill_unit(unavailable)
+        return unit
+
+    def _select_penalty_kill_unit(self, unavailable: Optional[Set[Player]]) -> List[Player]:
+        """Uncached penalty_kill_unit selection."""
+        ranked = self._by_defense
+        # Filtered cached ranking; see power_play_unit
+        skaters_sorted_def = [p for p in ranked if p not in unavailable] if unavailable else ranked
+        if not skaters_sorted_def:
             return []
 
         # Determine target size based on number unavailable among skaters
-        num_unavailable = sum(1 for p in all_skaters if p in unavailable)
+        num_unavailable = len(ranked) - len(skaters_sorted_def)
         target_size = max(0, 5 - num_unavailable)
         if target_size == 0:
             return []
 
-        defensive_score = lambda p: p.suppression + p.prevention
-        skaters_sorted_def = sorted(skaters, key=defensive_score, reverse=True)
+        defensive_score = _DEFENSE_KEY
         max_size = min(target_size, len(skaters_sorted_def))
         selected: List[Player] = skaters_sorted_def[:max_size]
+        # Set mirror of `selected` for O(1) membership checks during swaps and fills
+        selected_set = set(selected)
+        # `selected` stays in ranking order until a swap or fill appends out of order
+        reordered = False
 
-        def is_def(player: Player) -> bool:
-            return player.position == "D"
-
-        def_count = sum(1 for p in selected if is_def(p))
+        def_count = sum(1 for p in selected if p.is_defenseman)
 
         # Target counts given constraints and availability
-        total_ds_available = sum(1 for p in skaters if is_def(p))
+        total_ds_available = sum(1 for p in skaters_sorted_def if p.is_defenseman)
         min_ds = 2 if total_ds_available >= 2 else total_ds_available
         max_ds = min(3, max_size)
 
         # Ensure at least min_ds defensemen
         while def_count < min_ds:
-            available_ds = [p for p in skaters_sorted_def if is_def(p) and p not in selected]
-            if not available_ds:
+            best_d = _first_available(skaters_sorted_def, "D", selected_set)
+            if best_d is None:
                 break
             # Replace the lowest-defense forward, if any
-            forwards_in_selected = sorted([p for p in selected if p.position == "F"], key=defensive_score)
+            forwards_in_selected = [p for p in selected if p.position == "F"]
             if not forwards_in_selected:
                 # If we have only defensemen selected but def_count < min_ds due to size, just add if capacity
                 if len(selected) < max_size:
-                    selected.append(available_ds[0])
+                    selected.append(best_d)
+                    reordered = True
+                    selected_set.add(best_d)
                     def_count += 1
                 break
-            lowest_fwd = forwards_in_selected[0]
-            best_d = available_ds[0]
+            lowest_fwd = min(forwards_in_selected, key=defensive_score)
             selected.remove(lowest_fwd)
             selected.append(best_d)
+            reordered = True
+            selected_set.discard(lowest_fwd)
+            selected_set.add(best_d)
             def_count += 1
 
         # Cap at max_ds defensemen by replacing lowest-defense D with best available F
         while def_count > max_ds:
-            ds_in_selected = sorted([p for p in selected if is_def(p)], key=defensive_score)
-            forwards_available = [p for p in skaters_sorted_def if p.position == "F" and p not in selected]
-            if not ds_in_selected or not forwards_available:
+            ds_in_selected = [p for p in selected if p.is_defenseman]
+            best_f = _first_available(skaters_sorted_def, "F", selected_set)
+            if not ds_in_selected or best_f is None:
                 break
-            lowest_d = ds_in_selected[0]
-            best_f = forwards_available[0]
+            lowest_d = min(ds_in_selected, key=defensive_score)
             selected.remove(lowest_d)
             selected.append(best_f)
+            reordered = True
+            selected_set.discard(lowest_d)
+            selected_set.add(best_f)
             def_count -= 1
 
         # Fill if we have fewer than requested due to availability
         if len(selected) < max_size:
             for candidate in skaters_sorted_def:
-                if candidate in selected:
+                if candidate in selected_set:
                     continue
-                if candidate.position == "D" and def_count >= max_ds:
+                if candidate.is_defenseman and def_count >= max_ds:
                     continue
                 selected.append(candidate)
-                if candidate.position == "D":
+                reordered = True
+                selected_set.add(candidate)
+                if candidate.is_defenseman:
                     def_count += 1
                 if len(selected) == max_size:
                     break
 
         # Return sorted by defensive score for readability/consistency
-        return sorted(selected, key=defensive_score, reverse=True)
+        return sorted(selected, key=defensive_score, reverse=True) if reordered else selected
 
 class Division:
     """A division containing 4 teams."""
+    __slots__ = ('name', 'teams')
+
     def __init__(self, name: str, teams: List[Team]):
         self.name = name
         self.teams = list(teams)
@@ -461,27 +673,46 @@ class Division:
 
 class Conference:
     """A conference containing 4 divisions."""
+    __slots__ = ('name', 'divisions', '_all_teams')
+
     def __init__(self, name: str, divisions: List[Division]):
         self.name = name
         self.divisions = list(divisions)
         if len(self.divisions) != 4:
             raise ValueError(f"Conference must have exactly 4 divisions, got {len(self.divisions)}")
+        # Teams of all divisions in division order, flattened once
+        self._all_teams: List[Team] = [team for division in self.divisions for team in division.teams]
     
     def get_teams(self) -> List[Team]:
-        """Return all teams in this conference."""
-        teams = []
-        for division in self.divisions:
-            teams.extend(division.teams)
-        return teams
+        """Return all teams in this conference (cached; callers must not mutate the list)."""
+        return self._all_teams
 
 class League:
     """A collection of teams with basic management operations."""
+    __slots__ = ('teams', 'divisions', 'conferences', 'schedule', 'weeks', '_rng',
+                 '_name_to_division', '_name_to_conference')
+
     def __init__(self, teams: List[Team], divisions: Optional[List[Division]] = None, conferences: Optional[List[Conference]] = None):
         self.teams = list(teams) if teams is not None else []
         self.divisions: List[Division] = divisions if divisions else []
         self.conferences: List[Conference] = conferences if conferences else []
         self.schedule: List[Tuple[Team, Team]] = []
         self.weeks: List[List[Tuple[Team, Team]]] = []
+        self._rng: Optional[random.Random] = None  # Reseeded per use by _seeded_rng
+        # Team name -> division / conference, built on first lookup (see _index_teams)
+        self._name_to_division: Optional[Dict[str, Division]] = None
+        self._name_to_conference: Optional[Dict[str, Conference]] = None
+
+    def _seeded_rng(self, seed: int) -> random.Random:
+        """Return the league's private Random reseeded with `seed`.
+
+        Reseeding yields the same stream as random.Random(seed) without allocating
+        a new generator for every division and shuffle in each build_schedule call.
+        """
+        if self._rng is None:
+            self._rng = random.Random()
+        self._rng.seed(seed)
+        return self._rng
     
     def organize_into_divisions_and_conferences(self, seed: Optional[int] = None) -> None:
         """Organize 32 teams into 8 divisions (4 teams each) and 2 conferences (4 divisions each).
@@ -534,30 +765,43 @@ class League:
         
         self.divisions = divisions
         self.conferences = [conference1, conference2]
+        self._name_to_division = self._name_to_conference = None
     
-    def get_team_division(self, team: Team) -> Optional[Division]:
-        """Get the division for a given team."""
+    def _index_teams(self) -> None:
+        """Build the team name -> division / conference lookups.
+
+        The first division or conference listing a name wins, matching a front-to-back scan.
+        """
+        self._name_to_division = {}
         for division in self.divisions:
-            # Compare by name since team objects might be different instances
             for div_team in division.teams:
-                if div_team.name == team.name:
-                    return division
-        return None
-    
-    def get_team_conference(self, team: Team) -> Optional[Conference]:
-        """Get the conference for a given team."""
+                self._name_to_division.setdefault(div_team.name, division)
+        self._name_to_conference = {}
         for conference in self.conferences:
-            # Compare by name since team objects might be different instances
             for conf_team in conference.get_teams():
-                if conf_team.name == team.name:
-                    return conference
-        return None
+                self._name_to_conference.setdefault(conf_team.name, conference)
+
+    def get_team_division(self, team: Team) -> Optional[Division]:
+        """Get the division for a given team."""
+        # Keyed by name since team objects might be different instances
+        if self._name_to_division is None:
+            self._index_teams()
+        return self._name_to_division.get(team.name)
+
+    def get_team_conference(self, team: Team) -> Optional[Conference]:
+        """Get the conference for a given team."""
+        # Keyed by name since team objects might be different instances
+        if self._name_to_conference is None:
+            self._index_teams()
+        return self._name_to_conference.get(team.name)
 
     def add_team(self, team: Team) -> None:
         self.teams.append(team)
+        self._name_to_division = self._name_to_conference = None
 
     def remove_team(self, team: Team) -> None:
         self.teams.remove(team)
+        self._name_to_division = self._name_to_conference = None
 
     def build_schedule(self, shuffle: bool = True, seed: Optional[int] = None, group_weeks: bool = True) -> List[Tuple[Team, Team]]:
         """Create an NHL-style imbalanced schedule (82 games per team).
@@ -575,7 +819,6 @@ class League:
             raise ValueError("League must have divisions and conferences. Call organize_into_divisions_and_conferences() first.")
         
         games: List[Tuple[Team, Team]] = []
-        rng = random.Random(seed) if seed is not None else random
         
         # Track games per team pair (symmetric)
         pair_game_counts: Dict[Tuple[Team, Team], int] = {}
@@ -586,44 +829,29 @@ class League:
         # Mathematical constraint: For 4 teams with 6 pairs, we need exactly 4 pairs at 5 games and 2 pairs at 4 games
         # This ensures: 4 teams × (5+5+4) = 56 total game assignments, which equals (4×5 + 2×4) × 2 = 56 ✓
         for division in self.divisions:
-            teams = sorted(division.teams, key=lambda t: t.name)  # Sort for consistency
-            rng_div = random.Random(seed + hash(division.name)) if seed is not None else random
-            
-            # Create all 6 pairs in division
-            pairs = []
-            for i, team1 in enumerate(teams):
-                for team2 in teams[i+1:]:
-                    pair_key = tuple(sorted([team1, team2], key=lambda t: t.name))
-                    pairs.append((team1, team2, pair_key))
+            teams = sorted(division.teams, key=attrgetter('name'))  # Sort for consistency
+            rng_div = self._seeded_rng(seed + hash(division.name)) if seed is not None else random
             
-            # Initialize all pairs to 5 games
-            for t1, t2, pk in pairs:
-                pair_game_counts[pk] = 5
+            # Create all 6 pairs in division; teams are name-sorted, so each
+            # combination is already its own name-ordered pair key
+            pairs = [(team1, team2, (team1, team2)) for team1, team2 in combinations(teams, 2)]
             
             # Now we need to reduce 2 pairs to 4 games, ensuring each team still gets 14 games
             # Strategy: For each team, ensure it has exactly 2 pairs at 5 and 1 pair at 4
             # We'll assign which opponent each team plays 4 times
             team_4_game_opponents = {}
             for team in teams:
-                opponents = [t for t in teams if t != team]
+                opponents = [t for t in teams if t is not team]
                 # Randomly pick which opponent this team plays 4 times (others get 5)
                 opponent_4 = rng_div.choice(opponents)
                 team_4_game_opponents[team] = opponent_4
             
-            # Convert team assignments to pair counts
-            # For each pair, if either team wants to play the other 4 times, set to 4
-            # Otherwise keep at 5
-            for t1, t2, pk in pairs:
-                # If team1 wants to play team2 4 times, or team2 wants to play team1 4 times
-                if team_4_game_opponents.get(t1) == t2 or team_4_game_opponents.get(t2) == t1:
-                    pair_game_counts[pk] = 4
-                else:
-                    pair_game_counts[pk] = 5
-            
-            # Verify each team has exactly 14 division games
+            # Convert team assignments to pair counts, tallying each team's division games as we go:
+            # a pair drops to 4 if either team wants to play the other 4 times, otherwise it is 5
             team_totals = {team: 0 for team in teams}
             for t1, t2, pk in pairs:
-                count = pair_game_counts[pk]
+                count = 4 if team_4_game_opponents[t1] is t2 or team_4_game_opponents[t2] is t1 else 5
+                pair_game_counts[pk] = count
                 team_totals[t1] += count
                 team_totals[t2] += count
             
@@ -637,16 +865,22 @@ class League:
                 for t1, t2, pk in pairs:
                     pair_game_counts[pk] = 5
                 
-                # Apply known valid pattern
+                # Apply known valid pattern (teams are name-sorted, so these are the pair keys)
                 # (teams[0], teams[3]) = 4 games
-                pair_key_0_3 = tuple(sorted([teams[0], teams[3]], key=lambda t: t.name))
-                pair_game_counts[pair_key_0_3] = 4
+                pair_game_counts[(teams[0], teams[3])] = 4
                 # (teams[1], teams[2]) = 4 games  
-                pair_key_1_2 = tuple(sorted([teams[1], teams[2]], key=lambda t: t.name))
-                pair_game_counts[pair_key_1_2] = 4
+                pair_game_counts[(teams[1], teams[2])] = 4
                 # All other pairs remain at 5 games
         
         # Now assign conference and other conference games (symmetric)
+        # Each conference's opponents for inter-conference games, resolved once rather than per team
+        first_conference = self.conferences[0]
+        other_conference_of = {
+            conference: (self.conferences[1] if conference == first_conference else first_conference)
+            for conference in self.conferences
+        }
+        # Division rosters as sets for O(1) "same division" checks in the conference pass
+        division_members = {division: frozenset(division.teams) for division in self.divisions}
         for team in self.teams:
             team_division = self.get_team_division(team)
             team_conference = self.get_team_conference(team)
@@ -656,21 +890,19 @@ class League:
             
             # 2. Conference non-division opponents (12 teams): 3 games each = 36 games
             conference_teams = team_conference.get_teams()
-            conference_non_division = [t for t in conference_teams if t != team and t not in team_division.teams]
+            division_set = division_members[team_division]
+            conference_non_division = [t for t in conference_teams if t is not team and t not in division_set]
             
             for opponent in conference_non_division:
-                pair_key = tuple(sorted([team, opponent], key=lambda t: t.name))
-                if pair_key not in pair_game_counts:
-                    pair_game_counts[pair_key] = 3
+                pair_key = (team, opponent) if team.name <= opponent.name else (opponent, team)
+                pair_game_counts.setdefault(pair_key, 3)
             
             # 3. Other conference opponents (16 teams): 2 games each = 32 games
-            other_conference = self.conferences[1] if team_conference == self.conferences[0] else self.conferences[0]
-            other_conference_teams = other_conference.get_teams()
+            other_conference_teams = other_conference_of[team_conference].get_teams()
             
             for opponent in other_conference_teams:
-                pair_key = tuple(sorted([team, opponent], key=lambda t: t.name))
-                if pair_key not in pair_game_counts:
-                    pair_game_counts[pair_key] = 2
+                pair_key = (team, opponent) if team.name <= opponent.name else (opponent, team)
+                pair_game_counts.setdefault(pair_key, 2)
         
         # Build games from pair_game_counts, ensuring home/away balance
         for pair_key, total_games in pair_game_counts.items():
@@ -680,19 +912,14 @@ class League:
             home_first = team1 if team1.name < team2.name else team2
             away_first = team2 if home_first == team1 else team1
             
-            # Create games with home/away balance
-            for i in range(total_games):
-                # Alternate home/away, starting with home_first
-                if i % 2 == 0:
-                    games.append((home_first, away_first))
-                else:
-                    games.append((away_first, home_first))
+            # Create games with home/away balance: alternate home/away, starting with home_first
+            legs = [(home_first, away_first), (away_first, home_first)] * ((total_games + 1) // 2)
+            games.extend(legs[:total_games])
         
         # Shuffle the schedule if requested
         if shuffle:
             if seed is not None:
-                rng = random.Random(seed)
-                rng.shuffle(games)
+                self._seeded_rng(seed).shuffle(games)
             else:
                 random.shuffle(games)
         
@@ -706,38 +933,39 @@ class League:
 
         key should be one of: 'creation', 'conversion', 'suppression', 'prevention', 'goalkeeping', 'stamina', 'discipline', or 'total'.
         """
-        rows: List[Dict] = []
-        for team in self.teams:
-            for p in team.roster:
-                rows.append({
-                    'team': team.name,
-                    'player': p.name,
-                    'position': p.position,
-                    'creation': p.creation,
-                    'conversion': p.conversion,
-                    'suppression': p.suppression,
-                    'prevention': p.prevention,
-                    'goalkeeping': p.goalkeeping,
-                    'stamina': p.stamina,
-                    'discipline': p.discipline,
-                    'total': p.creation + p.conversion + p.suppression + p.prevention + p.goalkeeping
-                })
-        if key not in {'creation','conversion','suppression','prevention','goalkeeping','stamina','discipline','total'}:
+        if key not in RANKING_KEYS:
             key = 'creation'
-        rows.sort(key=lambda r: r[key], reverse=True)
-        return rows[:top_n]
+        # Partial selection over (team, player) pairs; only the top_n rows are materialized.
+        # heapq.nlargest is stable, so ties keep roster order exactly like a full sort would.
+        if key == 'total':
+            score = lambda tp: _ranking_total(tp[1])
+        else:
+            get_attr = attrgetter(key)
+            score = lambda tp: get_attr(tp[1])
+        pool = ((team, p) for team in self.teams for p in team.roster)
+        return [
+            {
+                'team': team.name,
+                'player': p.name,
+                'position': p.position,
+                'creation': p.creation,
+                'conversion': p.conversion,
+                'suppression': p.suppression,
+                'prevention': p.prevention,
+                'goalkeeping': p.goalkeeping,
+                'stamina': p.stamina,
+                'discipline': p.discipline,
+                'total': _ranking_total(p)
+            }
+            for team, p in heapq.nlargest(top_n, pool, key=score)
+        ]
 
     def get_teams(self) -> List[Dict]:
         """Return per-team summary: coach, playstyle, sums of roster attributes, HFA factors, and division/conference."""
         out: List[Dict] = []
         for team in self.teams:
-            creation_sum = sum(p.creation for p in team.roster)
-            conversion_sum = sum(p.conversion for p in team.roster)
-            suppression_sum = sum(p.suppression for p in team.roster)
-            prevention_sum = sum(p.prevention for p in team.roster)
-            goalkeeping_sum = sum(p.goalkeeping for p in team.roster)
-            sta = sum(p.stamina for p in team.roster)
-            dis = sum(p.discipline for p in team.roster)
+            (creation_sum, conversion_sum, suppression_sum, prevention_sum,
+             goalkeeping_sum, sta, dis) = team.roster_sums()
             
             # Get division and conference info
             team_division = self.get_team_division(team)
@@ -778,20 +1006,40 @@ class League:
         """
         games = list(schedule) if schedule is not None else list(self.schedule)
         weeks: List[List[Tuple[Team, Team]]] = []
-        remaining: List[Tuple[Team, Team]] = games
-        while remaining:
-            week: List[Tuple[Team, Team]] = []
-            used: Set[Team] = set()
-            nxt: List[Tuple[Team, Team]] = []
-            for home, away in remaining:
-                if (home in used) or (away in used):
-                    nxt.append((home, away))
-                    continue
-                week.append((home, away))
-                used.add(home)
-                used.add(away)
-            weeks.append(week)
-            remaining = nxt
+        # Each team owns one bit; a week's mask is the OR of its games' team bits, so a game
+        # fits a week iff the AND of the two masks is zero. Placing every game in the first
+        # week it fits reproduces repeated greedy passes over the remaining games.
+        team_bits: Dict[Team, int] = {}
+        week_masks: List[int] = []
+        # Per team, the first week it is not yet playing in; every earlier week already holds
+        # one of its games, so the first-fit scan for a game can start at the later of the two
+        first_open: Dict[Team, int] = {}
+        for home, away in games:
+            home_bit = team_bits.setdefault(home, 1 << len(team_bits))
+            away_bit = team_bits.setdefault(away, 1 << len(team_bits))
+            game_mask = home_bit | away_bit
+            home_open = first_open.get(home, 0)
+            away_open = first_open.get(away, 0)
+            w = home_open if home_open > away_open else away_open
+            n_weeks = len(week_masks)
+            while w < n_weeks and week_masks[w] & game_mask:
+                w += 1
+            if w < n_weeks:
+                week_masks[w] |= game_mask
+                weeks[w].append((home, away))
+            else:
+                week_masks.append(game_mask)
+                weeks.append([(home, away)])
+                n_weeks += 1
+            # Advance a team's first open week only when this game filled it
+            if w == home_open:
+                while home_open < n_weeks and week_masks[home_open] & home_bit:
+                    home_open += 1
+                first_open[home] = home_open
+            if w == away_open:
+                while away_open < n_weeks and week_masks[away_open] & away_bit:
+                    away_open += 1
+                first_open[away] = away_open
         return weeks
 
     def simulate_schedule(
@@ -845,17 +1093,24 @@ class League:
         selected = [w for w in selected if 1 <= w <= len(week_matrix)]
 
         game_id = 0
+        g: Optional[Game] = None  # one Game instance, reset for every matchup
+        first_week = min(selected) if selected else 0
         for wk_idx in selected:
             week = week_matrix[wk_idx - 1]
+            # pbp is only exported for the first pbp_weeks simulated weeks
+            export_pbp = pbp_weeks > 0 and (wk_idx - first_week + 1) <= pbp_weeks
             for home, away in week:
                 game_id += 1
-                g = Game(home, away)
+                if g is None:
+                    g = Game(home, away)
+                else:
+                    g.reset(home, away)
                 result = g.simulate_game()
                 home_name = home.name
                 away_name = away.name
                 hs = result['home_score']
                 as_ = result['away_score']
-                went_ot = any(e[1] == 'overtime_start' for e in g.events)
+                went_ot = g.went_ot
                 winner = home_name if hs > as_ else away_name
                 loser = away_name if hs > as_ else home_name
 
@@ -871,32 +1126,29 @@ class League:
                     'loser': loser
                 })
 
-                if (len(selected) and (wk_idx - min(selected) + 1) <= pbp_weeks) or (not selected and wk_idx <= pbp_weeks):
-                    for e in g.events:
-                        t = e[0]
-                        et = e[1]
-                        desc = e[2] if len(e) >= 3 else ''
-                        hs_e = e[3] if len(e) >= 4 else None
-                        as_e = e[4] if len(e) >= 5 else None
-                        tag = e[5] if len(e) >= 6 else ''
-                        home_on_ice = e[6] if len(e) >= 7 else []
-                        away_on_ice = e[7] if len(e) >= 8 else []
-                        period = int(t // 1200.0) + 1
-                        pbp_rows.append({
+                if export_pbp:
+                    # Game events share one fixed 9-field layout (see Game._log_event); the
+                    # game's rows are built in one comprehension and added with a single extend.
+                    # Period uses floor division, not t * (1/PERIOD_SECONDS): the reciprocal
+                    # rounds times one ulp below a boundary into the next period
+                    pbp_rows.extend([
+                        {
                             'game_id': game_id,
                             'week': wk_idx,
                             'home_team': home_name,
                             'away_team': away_name,
-                            'period': period,
+                            'period': int(t // PERIOD_SECONDS) + 1,
                             'time_seconds': f"{t:.2f}",
                             'event_type': et,
                             'description': desc,
                             'home_score': hs_e,
                             'away_score': as_e,
                             'tag': tag,
-                            'home_on_ice': '|'.join(home_on_ice) if home_on_ice else '',
-                            'away_on_ice': '|'.join(away_on_ice) if away_on_ice else ''
-                        })
+                            'home_on_ice': '|'.join(home_on_ice),
+                            'away_on_ice': '|'.join(away_on_ice)
+                        }
+                        for t, et, desc, hs_e, as_e, tag, home_on_ice, away_on_ice, _ in g.events
+                    ])
                 
                 # Generate box scores for all games
                 if generate_box_scores:
@@ -914,111 +1166,91 @@ class League:
         """Compute NHL-style standings from game rows.
 
         If by_week is False, returns a dict keyed by team name with cumulative totals.
-        If by_week is True, returns a dict mapping week -> list of standings rows as of that week.
+        If by_week is True, returns a dict mapping week -> list of standings rows as of that week;
+        weeks with identical standings share the same list, so treat the rows as read-only.
         """
-        # Initialize accumulator
-        base = {
-            'GP': 0, 'W': 0, 'OTW': 0, 'L': 0, 'OTL': 0, 'PTS': 0, 'GF': 0, 'GA': 0
-        }
         teams = [t.name for t in self.teams]
-        cumulative: Dict[str, Dict] = {name: dict(base) for name in teams}
+        team_idx = {name: i for i, name in enumerate(teams)}
+        # One [GP, W, OTW, L, OTL, PTS, GF, GA] row per team, indexed like self.teams
+        stats: List[List[int]] = [[0] * len(STANDINGS_COLUMNS) for _ in teams]
 
         # Optionally filter to games up through a given week
         rows_iter = game_rows
         if through_week is not None:
-            rows_iter = [r for r in game_rows if int(r['week']) <= int(through_week)]
+            last = int(through_week)
+            rows_iter = [r for r in game_rows if int(r['week']) <= last]
 
         if not by_week:
-            for row in rows_iter:
-                h = row['home_team']; a = row['away_team']
-                hs = row['home_score']; as_ = row['away_score']
-                ot = bool(row['went_ot'])
-                cumulative[h]['GP'] += 1
-                cumulative[a]['GP'] += 1
-                cumulative[h]['GF'] += hs; cumulative[h]['GA'] += as_
-                cumulative[a]['GF'] += as_; cumulative[a]['GA'] += hs
-                if hs > as_:
-                    if ot:
-                        cumulative[h]['OTW'] += 1; cumulative[h]['PTS'] += 2
-                        cumulative[a]['OTL'] += 1; cumulative[a]['PTS'] += 1
-                    else:
-                        cumulative[h]['W'] += 1; cumulative[h]['PTS'] += 2
-                        cumulative[a]['L'] += 1
-                else:
-                    if ot:
-                        cumulative[a]['OTW'] += 1; cumulative[a]['PTS'] += 2
-                        cumulative[h]['OTL'] += 1; cumulative[h]['PTS'] += 1
-                    else:
-                        cumulative[a]['W'] += 1; cumulative[a]['PTS'] += 2
-                        cumulative[h]['L'] += 1
-            return cumulative
+            _accumulate_standings(stats, team_idx, rows_iter)
+            return {name: dict(zip(STANDINGS_COLUMNS, s)) for name, s in zip(teams, stats)}
 
-        # by_week cumulative snapshots
+        # by_week cumulative snapshots: apply each run of same-week games in one call,
+        # snapshotting any weeks that are skipped over before the run starts. Standings
+        # do not change across a run of skipped weeks, so those weeks share one row list.
         snapshots: Dict[int, List[Dict]] = {}
-        last_week = 0
-        for row in rows_iter:
-            wk = int(row['week'])
-            # advance snapshots for skipped weeks if any
-            for w in range(last_week + 1, wk):
-                # store a deep-ish copy snapshot
-                snap_rows: List[Dict] = []
-                for team_name, s in cumulative.items():
-                    gd = s['GF'] - s['GA']
-                    snap_rows.append({
-                        'team': team_name,
-                        'GP': s['GP'], 'W': s['W'], 'OTW': s['OTW'], 'L': s['L'], 'OTL': s['OTL'],
-                        'PTS': s['PTS'], 'GF': s['GF'], 'GA': s['GA'], 'GD': gd
-                    })
-                snap_rows.sort(key=lambda r: (r['PTS'], r['GD'], r['GF']), reverse=True)
-                snapshots[w] = snap_rows
+        last_week = max_week = 0
+        for wk, week_rows in groupby(rows_iter, key=lambda r: int(r['week'])):
+            if wk > last_week + 1:
+                snap_rows = _standings_snapshot(teams, stats)
+                for w in range(last_week + 1, wk):
+                    snapshots[w] = snap_rows
             last_week = wk
+            if wk > max_week:
+                max_week = wk
+            _accumulate_standings(stats, team_idx, week_rows)
 
-            # apply this game
-            h = row['home_team']; a = row['away_team']
-            hs = row['home_score']; as_ = row['away_score']
-            ot = bool(row['went_ot'])
-            cumulative[h]['GP'] += 1
-            cumulative[a]['GP'] += 1
-            cumulative[h]['GF'] += hs; cumulative[h]['GA'] += as_
-            cumulative[a]['GF'] += as_; cumulative[a]['GA'] += hs
-            if hs > as_:
-                if ot:
-                    cumulative[h]['OTW'] += 1; cumulative[h]['PTS'] += 2
-                    cumulative[a]['OTL'] += 1; cumulative[a]['PTS'] += 1
-                else:
-                    cumulative[h]['W'] += 1; cumulative[h]['PTS'] += 2
-                    cumulative[a]['L'] += 1
-            else:
-                if ot:
-                    cumulative[a]['OTW'] += 1; cumulative[a]['PTS'] += 2
-                    cumulative[h]['OTL'] += 1; cumulative[h]['PTS'] += 1
-                else:
-                    cumulative[a]['W'] += 1; cumulative[a]['PTS'] += 2
-                    cumulative[h]['L'] += 1
-
-            # snapshot at end of this week if this was the week's last game will be done below
-            # We cannot know directly without week structure; simpler: after loop, ensure final week snapshot
-
-        # ensure final week snapshot present
+        # ensure final week snapshot present; every week still missing sees the final standings
         if game_rows:
-            max_week = max(int(r['week']) for r in game_rows)
+            if through_week is not None:
+                max_week = max(int(r['week']) for r in game_rows)
+            final_rows = None
             for w in range(1, max_week + 1):
                 if w not in snapshots:
-                    snap_rows = []
-                    for team_name, s in cumulative.items():
-                        gd = s['GF'] - s['GA']
-                        snap_rows.append({
-                            'team': team_name,
-                            'GP': s['GP'], 'W': s['W'], 'OTW': s['OTW'], 'L': s['L'], 'OTL': s['OTL'],
-                            'PTS': s['PTS'], 'GF': s['GF'], 'GA': s['GA'], 'GD': gd
-                        })
-                    snap_rows.sort(key=lambda r: (r['PTS'], r['GD'], r['GF']), reverse=True)
-                    snapshots[w] = snap_rows
+                    if final_rows is None:
+                        final_rows = _standings_snapshot(teams, stats)
+                    snapshots[w] = final_rows
 
         return snapshots
 
+def _on_ice_summary(players: List[Player]) -> Tuple[float, float, float, float, float, float]:
+    """Summarize an on-ice unit in a single pass for Game's per-shift caches.
+
+    Returns (creation_sum, suppression_sum, conversion_sum, prevention_sum, goalie_goalkeeping,
+    pen_mult). Sums cover skaters only and accumulate in on-ice order; the penalty multiplier is
+    the mean of Player.pen_weight over skaters, normalized and clamped.
+    """
+    creation = suppression = conversion = prevention = weight_sum = 0.0
+    n_skaters = 0
+    goalie = None
+    for p in players:
+        if p.is_goalie:
+            if goalie is None:
+                goalie = p
+            continue
+        creation += p.creation
+        suppression += p.suppression
+        conversion += p.conversion
+        prevention += p.prevention
+        weight_sum += p.pen_weight
+        n_skaters += 1
+    pen_mult = (weight_sum / n_skaters if n_skaters else 1.0) / PEN_NORM
+    pen_mult = PEN_CLAMP_LO if pen_mult < PEN_CLAMP_LO else (PEN_CLAMP_HI if pen_mult > PEN_CLAMP_HI else pen_mult)
+    return (creation, suppression, conversion, prevention,
+            goalie.goalkeeping if goalie else 0.0, pen_mult)
+
+# (team, unit) -> (clock key to resample, event description) for team-specific line changes,
+# built once so the per-change strings are shared instead of formatted on every change
+_LINE_CHANGE_LABELS: Dict[Tuple[str, Optional[str]], Tuple[str, str]] = {
+    (team, unit): (f"{team}_{'forward' if unit == 'forward' else 'defense'}",
+                   f"{'Home' if team == 'home' else 'Away'} "
+                   f"{'forward line' if unit == 'forward' else ('defensive pair' if unit == 'defense' else 'lines and pairs')} change")
+    for team in ('home', 'away') for unit in ('forward', 'defense', None)
+}
+
 class Period:
     """Represents a single period of a hockey game."""
+    __slots__ = ('period_number', 'duration_seconds', 'is_overtime', 'start_time', 'end_time', 'events')
+
     def __init__(self, period_number: int, duration_seconds: float, is_overtime: bool = False):
         self.period_number = period_number
         self.duration_seconds = duration_seconds
@@ -1043,7 +1275,29 @@ class Period:
 
 class Game:
     """Simulates a game between two teams using shift-based Poisson events."""
+    __slots__ = ('home_team', 'away_team', 'home_score', 'away_score', 'current_time', 'current_period',
+                 'home_on_ice', 'away_on_ice', 'events', 'went_ot',
+                 'home_line_id', 'home_pair_id', 'away_line_id', 'away_pair_id',
+                 'home_fwd_deadline', 'home_def_deadline', 'away_fwd_deadline', 'away_def_deadline',
+                 'penalized_team', 'home_penalties', 'away_penalties',
+                 '_home_expiries', '_away_expiries', '_home_expired', '_away_expired', '_penalty_seq',
+                 'unavailable_home', 'unavailable_away', 'special_home_skaters', 'special_away_skaters',
+                 'pulled_team', 'home_players', 'away_players', '_home_on_ice_names', '_away_on_ice_names',
+                 # Per-shift on-ice caches built by _rebuild_on_ice_caches
+                 '_home_creation_sum', '_home_suppression_sum', '_away_creation_sum', '_away_suppression_sum',
+                 '_home_conversion_sum', '_home_prevention_sum', '_away_conversion_sum', '_away_prevention_sum',
+                 '_home_goalie_goalkeeping', '_away_goalie_goalkeeping', '_home_pen_mult', '_away_pen_mult',
+                 '_home_pen_rate', '_away_pen_rate')
+
     def __init__(self, home_team: Team, away_team: Team):
+        self.reset(home_team, away_team)
+
+    def reset(self, home_team: Team, away_team: Team) -> None:
+        """Return to a pre-game state for a new matchup so one instance can simulate many games.
+
+        Every per-game container is replaced rather than cleared, so events returned by a
+        previous simulate_game() stay valid.
+        """
         self.home_team = home_team
         self.away_team = away_team
         self.home_score = 0
@@ -1052,9 +1306,8 @@ class Game:
         self.current_period = None
         self.home_on_ice = None
         self.away_on_ice = None
-        self.home_penalties = []  # List of (player, time_remaining)
-        self.away_penalties = []
-        self.events = []  # List of (time, event_type, description)
+        self.events = []  # List of 9-field event tuples, see _log_event
+        self.went_ot = False  # Set when the first overtime period starts
         # Track current line/pair for rotation
         self.home_line_id = 1
         self.home_pair_id = 1
@@ -1068,26 +1321,44 @@ class Game:
         # Penalty / special-teams state
         self.penalized_team: Optional[str] = None  # set when one side is shorthanded
         # Active penalties per side: list of dicts with current segment end and metadata
-        # {'player': Player|None, 'type': 'minor'|'double_minor'|'major', 'segments_left': int, 'segment_end': float}
+        # {'player': Player|None, 'type': 'minor'|'double_minor'|'major', 'segments_left': int, 'segment_end': float,
+        #  'order': int, 'expiry_id': int|None}  (the last two are bookkeeping for the expiry heaps)
         self.home_penalties: List[Dict] = []
         self.away_penalties: List[Dict] = []
+        # Min-heaps of (segment_end, order, expiry_id, penalty) per side. Entries are invalidated
+        # lazily: a record is live only while its expiry_id matches the penalty's. Penalties whose
+        # segment has lapsed stay in the lists (as they always have) and are tallied as expired.
+        self._home_expiries: List[Tuple[float, int, int, Dict]] = []
+        self._away_expiries: List[Tuple[float, int, int, Dict]] = []
+        self._home_expired = 0
+        self._away_expired = 0
+        self._penalty_seq = 0
         self.unavailable_home: Set[Player] = set()
         self.unavailable_away: Set[Player] = set()
         self.special_home_skaters: Optional[List[Player]] = None
         self.special_away_skaters: Optional[List[Player]] = None
         # Pulled goalie state: 'home'|'away'|None
         self.pulled_team: Optional[str] = None
+        # On-ice units and name tuples for event logging; refreshed by _rebuild_on_ice_caches
+        self.home_players: List[Player] = []
+        self.away_players: List[Player] = []
+        self._home_on_ice_names: Tuple[str, ...] = ()
+        self._away_on_ice_names: Tuple[str, ...] = ()
     
     def start_shift(self) -> None:
         """Initialize a fresh shift: rebuild on-ice and resample all four clocks."""
         self._rebuild_on_ice_caches()
         self._resample_clocks()
 
-    def _current_on_ice_names(self) -> Tuple[List[str], List[str]]:
-        """Return current on-ice player name lists for home and away."""
-        home_names = [p.name for p in getattr(self, 'home_players', [])]
-        away_names = [p.name for p in getattr(self, 'away_players', [])]
-        return home_names, away_names
+    def _log_event(self, event_type: str, description: str, tag: str = '', detail=None) -> None:
+        """Append an event stamped with the current time, score and cached on-ice names.
+
+        Events are always (time, type, description, home_score, away_score, tag, home_on_ice,
+        away_on_ice, detail), where detail is the shot xG, goal assists or penalty minutes and None
+        for every other event type.
+        """
+        self.events.append((self.current_time, event_type, description, self.home_score, self.away_score,
+                            tag, self._home_on_ice_names, self._away_on_ice_names, detail))
 
     def _rebuild_on_ice_caches(self) -> None:
         """Rebuild on-ice units and caches without touching line-change clocks."""
@@ -1098,63 +1369,140 @@ class Game:
             home_override = self._compute_pulled_skaters('home')
         elif self.pulled_team == 'away':
             away_override = self._compute_pulled_skaters('away')
-        self.home_players = self._build_on_ice_players(self.home_team, self.home_line_id, self.home_pair_id, self.home_team.goalies()[0], home_override)
-        self.away_players = self._build_on_ice_players(self.away_team, self.away_line_id, self.away_pair_id, self.away_team.goalies()[0], away_override)
-        
-        # Cache attributes for shot rate calculations (creation affects shot rates, suppression reduces them)
-        self._home_creation_sum = sum(p.creation for p in self.home_players if p.position != 'G')
-        self._home_suppression_sum = sum(p.suppression for p in self.home_players if p.position != 'G')
-        self._away_creation_sum = sum(p.creation for p in self.away_players if p.position != 'G')
-        self._away_suppression_sum = sum(p.suppression for p in self.away_players if p.position != 'G')
-        
-        # Cache attributes for xG calculations (conversion increases xG, prevention reduces it)
-        self._home_conversion_sum = sum(p.conversion for p in self.home_players if p.position != 'G')
-        self._home_prevention_sum = sum(p.prevention for p in self.home_players if p.position != 'G')
-        self._away_conversion_sum = sum(p.conversion for p in self.away_players if p.position != 'G')
-        self._away_prevention_sum = sum(p.prevention for p in self.away_players if p.position != 'G')
-        
-        # Goalie goalkeeping (only for goalies on ice, reduces xG)
-        home_goalie = next((p for p in self.home_players if p.position == 'G'), None)
-        away_goalie = next((p for p in self.away_players if p.position == 'G'), None)
-        self._home_goalie_goalkeeping = home_goalie.goalkeeping if home_goalie else 0.0
-        self._away_goalie_goalkeeping = away_goalie.goalkeeping if away_goalie else 0.0
-        
-        # Discipline multipliers (normalized)
-        hw = [math.exp(-PEN_BETA * p.discipline) for p in self.home_players if p.position != 'G']
-        aw = [math.exp(-PEN_BETA * p.discipline) for p in self.away_players if p.position != 'G']
-        self._home_pen_mult = (sum(hw)/len(hw) if hw else 1.0) / PEN_NORM
-        self._away_pen_mult = (sum(aw)/len(aw) if aw else 1.0) / PEN_NORM
-        self._home_pen_mult = min(PEN_CLAMP_HI, max(PEN_CLAMP_LO, self._home_pen_mult))
-        self._away_pen_mult = min(PEN_CLAMP_HI, max(PEN_CLAMP_LO, self._away_pen_mult))
+        home_goalie = self.home_team.goalies()[0]
+        away_goalie = self.away_team.goalies()[0]
+        self.home_players = self._build_on_ice_players(self.home_team, self.home_line_id, self.home_pair_id, home_goalie, home_override)
+        self.away_players = self._build_on_ice_players(self.away_team, self.away_line_id, self.away_pair_id, away_goalie, away_override)
+        # One summary per side caches everything the shift needs:
+        # - skater creation/suppression sums for shot rates
+        # - skater conversion/prevention sums for xG
+        # - goalkeeping of the goalie on ice (0.0 when pulled)
+        # - normalized, clamped discipline multiplier for penalty rates
+        # Regular line+pair units reuse the team's per-combination names and summary plus the goalie.
+        # The name tuples are shared by every event logged until the next rebuild.
+        if home_override:
+            self._home_on_ice_names = tuple(p.name for p in self.home_players)
+            (self._home_creation_sum, self._home_suppression_sum, self._home_conversion_sum,
+             self._home_prevention_sum, self._home_goalie_goalkeeping, self._home_pen_mult) = _on_ice_summary(self.home_players)
+        else:
+            self._home_on_ice_names = self.home_team.line_pair_names(self.home_line_id, self.home_pair_id) + (home_goalie.name,)
+            (self._home_creation_sum, self._home_suppression_sum, self._home_conversion_sum,
+             self._home_prevention_sum, _, self._home_pen_mult) = self.home_team.line_pair_summary(self.home_line_id, self.home_pair_id)
+            self._home_goalie_goalkeeping = home_goalie.goalkeeping
+        if away_override:
+            self._away_on_ice_names = tuple(p.name for p in self.away_players)
+            (self._away_creation_sum, self._away_suppression_sum, self._away_conversion_sum,
+             self._away_prevention_sum, self._away_goalie_goalkeeping, self._away_pen_mult) = _on_ice_summary(self.away_players)
+        else:
+            self._away_on_ice_names = self.away_team.line_pair_names(self.away_line_id, self.away_pair_id) + (away_goalie.name,)
+            (self._away_creation_sum, self._away_suppression_sum, self._away_conversion_sum,
+             self._away_prevention_sum, _, self._away_pen_mult) = self.away_team.line_pair_summary(self.away_line_id, self.away_pair_id)
+            self._away_goalie_goalkeeping = away_goalie.goalkeeping
+        # Penalty rates depend only on the on-ice discipline multipliers, so they are fixed until
+        # the next rebuild: base 6 per team per 60 minutes, with home-ice advantage on the home
+        # team's penalty draw rate
+        self._home_pen_rate = PEN_BASE * self._home_pen_mult * HFA_PENALTY_MULT
+        self._away_pen_rate = PEN_BASE * self._away_pen_mult
 
     def _resample_clocks(self, unit: Optional[str] = None) -> None:
         """Resample line-change clocks. If unit is None, resample all; else just that unit."""
-        import random as _r
         # Determine if special teams is active (any side not at 5 skaters)
-        active_home = sum(1 for p in self.home_penalties if p['segment_end'] > self.current_time)
-        active_away = sum(1 for p in self.away_penalties if p['segment_end'] > self.current_time)
+        active_home = self._active_penalty_count('home')
+        active_away = self._active_penalty_count('away')
         special = (self.pulled_team is not None) or not (active_home == 0 and active_away == 0)
         fwd_low, fwd_high = (50.0, 70.0) if special else (30.0, 60.0)
         def_low, def_high = ((100.0, 120.0) if special else (40.0, 60.0))
         if unit is None:
-            # Set absolute deadlines from current time
-            self.home_fwd_deadline = self.current_time + _r.uniform(fwd_low, fwd_high)
-            self.home_def_deadline = self.current_time + _r.uniform(def_low, def_high)
-            self.away_fwd_deadline = self.current_time + _r.uniform(fwd_low, fwd_high)
-            self.away_def_deadline = self.current_time + _r.uniform(def_low, def_high)
+            # Set absolute deadlines from current time (same draw order: hf, hd, af, ad)
+            uniform = random.uniform
+            now = self.current_time
+            self.home_fwd_deadline = now + uniform(fwd_low, fwd_high)
+            self.home_def_deadline = now + uniform(def_low, def_high)
+            self.away_fwd_deadline = now + uniform(fwd_low, fwd_high)
+            self.away_def_deadline = now + uniform(def_low, def_high)
             return
         if unit == 'home_forward':
-            self.home_fwd_deadline = self.current_time + _r.uniform(fwd_low, fwd_high)
+            self.home_fwd_deadline = self.current_time + random.uniform(fwd_low, fwd_high)
         elif unit == 'home_defense':
-            self.home_def_deadline = self.current_time + _r.uniform(def_low, def_high)
+            self.home_def_deadline = self.current_time + random.uniform(def_low, def_high)
         elif unit == 'away_forward':
-            self.away_fwd_deadline = self.current_time + _r.uniform(fwd_low, fwd_high)
+            self.away_fwd_deadline = self.current_time + random.uniform(fwd_low, fwd_high)
         elif unit == 'away_defense':
-            self.away_def_deadline = self.current_time + _r.uniform(def_low, def_high)
+            self.away_def_deadline = self.current_time + random.uniform(def_low, def_high)
+
+    def _push_expiry(self, side: str, penalty: Dict) -> None:
+        """Schedule the current segment end of `penalty`, superseding any earlier record."""
+        self._penalty_seq += 1
+        penalty['expiry_id'] = self._penalty_seq
+        heap = self._home_expiries if side == 'home' else self._away_expiries
+        record = (penalty['segment_end'], penalty['order'], self._penalty_seq, penalty)
+        if heap and heap[0][3] is penalty:
+            # Extending the oldest penalty (the usual case): swap its record out in one step
+            heapq.heapreplace(heap, record)
+        else:
+            heapq.heappush(heap, record)
+
+    def _add_penalty(self, side: str, penalty: Dict) -> None:
+        """Append a new penalty for `side` and schedule its expiry."""
+        self._penalty_seq += 1
+        penalty['order'] = self._penalty_seq  # list order, breaks ties between equal segment ends
+        (self.home_penalties if side == 'home' else self.away_penalties).append(penalty)
+        self._push_expiry(side, penalty)
+
+    def _expire_penalty(self, side: str, penalty: Dict) -> None:
+        """Remove an active penalty for `side`."""
+        penalties = self.home_penalties if side == 'home' else self.away_penalties
+        # Swap-pop by identity: expiry ties are broken by 'order', not list position, and the
+        # list tail is only read right after _add_penalty appends
+        for i, q in enumerate(penalties):
+            if q is penalty:
+                penalties[i] = penalties[-1]
+                penalties.pop()
+                break
+        penalty['expiry_id'] = None
+        heap = self._home_expiries if side == 'home' else self._away_expiries
+        if heap and heap[0][3] is penalty:
+            heapq.heappop(heap)  # otherwise its record is dropped lazily
+
+    def _advance_expiries(self, side: str) -> List[Tuple[float, int, int, Dict]]:
+        """Tally segments that have lapsed by current_time and return the side's heap.
+
+        Afterwards the heap top, if any, is the active penalty with the earliest segment end.
+        """
+        if side == 'home':
+            heap = self._home_expiries
+        else:
+            heap = self._away_expiries
+        now = self.current_time
+        while heap:
+            end, _, expiry_id, penalty = heap[0]
+            if penalty['expiry_id'] != expiry_id:
+                heapq.heappop(heap)  # superseded or removed
+            elif end <= now:
+                heapq.heappop(heap)
+                penalty['expiry_id'] = None
+                if side == 'home':
+                    self._home_expired += 1
+                else:
+                    self._away_expired += 1
+            else:
+                break
+        return heap
+
+    def _active_penalty_count(self, side: str) -> int:
+        """Number of penalties for `side` whose current segment ends after current_time."""
+        self._advance_expiries(side)
+        if side == 'home':
+            return len(self.home_penalties) - self._home_expired
+        return len(self.away_penalties) - self._away_expired
+
+    def _oldest_active_penalty(self, side: str) -> Optional[Dict]:
+        """Active penalty for `side` with the earliest segment end, or None."""
+        heap = self._advance_expiries(side)
+        return heap[0][3] if heap else None
 
     def _enter_power_play(self, offending_team: str) -> None:
         """Initialize special teams units and penalty timer for a new minor penalty."""
-        import random as _r
         # Sample penalty type per requested proportions
         r = random.random()
         if r < 0.985:
@@ -1171,93 +1519,83 @@ class Game:
             segments = 1
         segment_end = self.current_time + duration
         # Choose a penalized skater from current on-ice, fallback to roster
-        if offending_team == 'home':
-            penalized = self._select_penalized_skater('home')
-            self.home_penalties.append({'player': penalized, 'type': ptype, 'segments_left': segments, 'segment_end': segment_end})
-            if penalized is not None:
-                self.unavailable_home.add(penalized)
-            # PK for home, PP for away
+        is_home = offending_team == 'home'
+        side = 'home' if is_home else 'away'
+        penalized = self._select_penalized_skater(side)
+        self._add_penalty(side, {'player': penalized, 'type': ptype, 'segments_left': segments, 'segment_end': segment_end})
+        if penalized is not None:
+            (self.unavailable_home if is_home else self.unavailable_away).add(penalized)
+        # Offending side kills the penalty, the other side goes on the power play
+        if is_home:
             self.special_home_skaters = self.home_team.penalty_kill_unit(unavailable=self.unavailable_home)
             self.special_away_skaters = self.away_team.power_play_unit(unavailable=self.unavailable_away)
-            # Label 4v4 or 3v3 correctly
-            n_home = max(3, 5 - sum(1 for p in self.home_penalties if p['segment_end'] > self.current_time))
-            n_away = max(3, 5 - sum(1 for p in self.away_penalties if p['segment_end'] > self.current_time))
-            h_oi, a_oi = self._current_on_ice_names()
-            if n_home == n_away and n_home < 5:
-                self.events.append((self.current_time, 'pp_start', f'{n_home}v{n_away} starts', self.home_score, self.away_score, f'{n_home}v{n_away}', h_oi, a_oi))
-            else:
-                self.events.append((self.current_time, 'pp_start', 'Away power play starts (home shorthanded)', self.home_score, self.away_score, 'away_pp', h_oi, a_oi))
         else:
-            penalized = self._select_penalized_skater('away')
-            self.away_penalties.append({'player': penalized, 'type': ptype, 'segments_left': segments, 'segment_end': segment_end})
-            if penalized is not None:
-                self.unavailable_away.add(penalized)
-            # PK for away, PP for home
             self.special_home_skaters = self.home_team.power_play_unit(unavailable=self.unavailable_home)
             self.special_away_skaters = self.away_team.penalty_kill_unit(unavailable=self.unavailable_away)
-            n_home = max(3, 5 - sum(1 for p in self.home_penalties if p['segment_end'] > self.current_time))
-            n_away = max(3, 5 - sum(1 for p in self.away_penalties if p['segment_end'] > self.current_time))
-            h_oi, a_oi = self._current_on_ice_names()
-            if n_home == n_away and n_home < 5:
-                self.events.append((self.current_time, 'pp_start', f'{n_home}v{n_away} starts', self.home_score, self.away_score, f'{n_home}v{n_away}', h_oi, a_oi))
-            else:
-                self.events.append((self.current_time, 'pp_start', 'Home power play starts (away shorthanded)', self.home_score, self.away_score, 'home_pp', h_oi, a_oi))
+        # Label 4v4 or 3v3 correctly
+        n_home = max(3, 5 - self._active_penalty_count('home'))
+        n_away = max(3, 5 - self._active_penalty_count('away'))
+        if n_home == n_away and n_home < 5:
+            self._log_event('pp_start', f'{n_home}v{n_away} starts', f'{n_home}v{n_away}')
+        elif is_home:
+            self._log_event('pp_start', 'Away power play starts (home shorthanded)', 'away_pp')
+        else:
+            self._log_event('pp_start', 'Home power play starts (away shorthanded)', 'home_pp')
 
     def _end_one_penalty(self, side: str) -> None:
         """Expire the oldest minor for the given side ('home' or 'away')."""
         if side == 'home' and self.home_penalties:
             # oldest = with smallest segment_end > current_time
-            active = [p for p in self.home_penalties if p['segment_end'] > self.current_time]
-            if active:
-                oldest = min(active, key=lambda d: d['segment_end'])
+            oldest = self._oldest_active_penalty('home')
+            if oldest is not None:
                 if oldest['type'] == 'major':
                     # Majors do not end on PP goals
                     pass
                 elif oldest['type'] == 'double_minor' and oldest['segments_left'] > 1:
                     oldest['segments_left'] -= 1
                     oldest['segment_end'] = self.current_time + 120.0
+                    self._push_expiry('home', oldest)
                 else:
                     # remove this penalty
-                    self.home_penalties.remove(oldest)
+                    self._expire_penalty('home', oldest)
                     p = oldest.get('player')
                     if p is not None:
                         self.unavailable_home.discard(p)
         elif side == 'away' and self.away_penalties:
-            active = [p for p in self.away_penalties if p['segment_end'] > self.current_time]
-            if active:
-                oldest = min(active, key=lambda d: d['segment_end'])
+            oldest = self._oldest_active_penalty('away')
+            if oldest is not None:
                 if oldest['type'] == 'major':
                     pass
                 elif oldest['type'] == 'double_minor' and oldest['segments_left'] > 1:
                     oldest['segments_left'] -= 1
                     oldest['segment_end'] = self.current_time + 120.0
+                    self._push_expiry('away', oldest)
                 else:
-                    self.away_penalties.remove(oldest)
+                    self._expire_penalty('away', oldest)
                     p = oldest.get('player')
                     if p is not None:
                         self.unavailable_away.discard(p)
         # If no active penalties remain for a side, log full strength
         # Announce correct state at this moment
-        n_home = max(3, 5 - sum(1 for p in self.home_penalties if p['segment_end'] > self.current_time))
-        n_away = max(3, 5 - sum(1 for p in self.away_penalties if p['segment_end'] > self.current_time))
-        h_oi, a_oi = self._current_on_ice_names()
+        n_home = max(3, 5 - self._active_penalty_count('home'))
+        n_away = max(3, 5 - self._active_penalty_count('away'))
         if n_home == 5 and n_away == 5:
-            self.events.append((self.current_time, 'pp_end', 'Back to full strength (5v5)', self.home_score, self.away_score, 'full', h_oi, a_oi))
+            self._log_event('pp_end', 'Back to full strength (5v5)', 'full')
         elif n_home == n_away:
-            self.events.append((self.current_time, 'pp_end', f'{n_home}v{n_away} continues', self.home_score, self.away_score, f'{n_home}v{n_away}', h_oi, a_oi))
+            self._log_event('pp_end', f'{n_home}v{n_away} continues', f'{n_home}v{n_away}')
         elif n_home > n_away:
-            self.events.append((self.current_time, 'pp_end', 'Home power play begins', self.home_score, self.away_score, 'home_pp', h_oi, a_oi))
+            self._log_event('pp_end', 'Home power play begins', 'home_pp')
         else:
-            self.events.append((self.current_time, 'pp_end', 'Away power play begins', self.home_score, self.away_score, 'away_pp', h_oi, a_oi))
+            self._log_event('pp_end', 'Away power play begins', 'away_pp')
         # Recompute special units based on remaining penalties
         self._recompute_special_units()
 
     def _recompute_special_units(self) -> None:
         """Set special team skaters based on current penalty stacks."""
-        active_home = sum(1 for p in self.home_penalties if p['segment_end'] > self.current_time)
-        active_away = sum(1 for p in self.away_penalties if p['segment_end'] > self.current_time)
-        n_home = max(3, 5 - active_home)
-        n_away = max(3, 5 - active_away)
+        active_home = self._active_penalty_count('home')
+        active_away = self._active_penalty_count('away')
+        n_home = 3 if active_home >= 2 else 5 - active_home
+        n_away = 3 if active_away >= 2 else 5 - active_away
         self.penalized_team = None
         # Even strength
         if n_home == 5 and n_away == 5:
@@ -1296,30 +1634,24 @@ class Game:
     def _select_penalized_skater(self, team: str) -> Optional[Player]:
         """Select a penalized skater on-ice weighted by indiscipline (lower discipline → higher chance).
 
-        We transform discipline (standard normal) to nonnegative weights with a softplus-like mapping:
-        weight = 1 + max(0, -discipline).
+        Each skater's weight is Player.pen_select_weight, exp(-PEN_SELECT_BETA * discipline),
+        computed once when the player is created.
         If no on-ice skaters are available (should not happen), fallback to roster with same logic.
         """
-        import random as _r
         if team == 'home':
-            pool = [p for p in self.home_players if p.position != 'G'] if hasattr(self, 'home_players') and self.home_players else (self.home_team.forwards() + self.home_team.defensemen())
+            pool = [p for p in self.home_players if not p.is_goalie] if self.home_players else (self.home_team.forwards() + self.home_team.defensemen())
         else:
-            pool = [p for p in self.away_players if p.position != 'G'] if hasattr(self, 'away_players') and self.away_players else (self.away_team.forwards() + self.away_team.defensemen())
+            pool = [p for p in self.away_players if not p.is_goalie] if self.away_players else (self.away_team.forwards() + self.away_team.defensemen())
         if not pool:
             return None
         # Exponential weighting across full range so every discipline point matters
-        beta = 0.55  # exp(+/- 2*beta) ≈ 3x odds across 2 SDs
-        weights = [float(__import__('math').exp(-beta * p.discipline)) for p in pool]
-        total = sum(weights)
+        cdf = list(accumulate(p.pen_select_weight for p in pool))
+        total = cdf[-1]
         if total <= 0:
-            return _r.choice(pool)
-        r = _r.random() * total
-        acc = 0.0
-        for p, w in zip(pool, weights):
-            acc += w
-            if r <= acc:
-                return p
-        return pool[-1]
+            return random.choice(pool)
+        # First skater whose cumulative weight reaches r (same as scanning with r <= acc)
+        idx = bisect_left(cdf, random.random() * total)
+        return pool[idx] if idx < len(pool) else pool[-1]
     
     def _build_on_ice_players(self, team: 'Team', f_line_id: int, d_pair_id: int, goalie: Player, skaters_override: Optional[List[Player]] = None) -> List[Player]:
         """Compose the on-ice unit: 5 skaters + goalie, honoring special-teams overrides."""
@@ -1330,9 +1662,7 @@ class Game:
                (team is self.away_team and self.pulled_team == 'away' and len(skaters_override) >= 6):
                 return list(skaters_override)
             return list(skaters_override) + [goalie]
-        forwards = team.lines[f_line_id]
-        defensemen = team.pairs[d_pair_id]
-        return forwards + defensemen + [goalie]
+        return [*team.line_pair(f_line_id, d_pair_id), goalie]
 
     def _compute_pulled_skaters(self, side: str) -> List[Player]:
         """Return 6 skaters for the pulled-goalie side using PP-style logic with an extra attacker.
@@ -1342,14 +1672,14 @@ class Game:
         """
         if side == 'home':
             team = self.home_team
-            base = list(self.special_home_skaters) if self.special_home_skaters else (self.home_team.lines[self.home_line_id] + self.home_team.pairs[self.home_pair_id])
+            base = self.special_home_skaters or self.home_team.line_pair(self.home_line_id, self.home_pair_id)
         else:
             team = self.away_team
-            base = list(self.special_away_skaters) if self.special_away_skaters else (self.away_team.lines[self.away_line_id] + self.away_team.pairs[self.away_pair_id])
-        base = [p for p in base if p.position != 'G']
+            base = self.special_away_skaters or self.away_team.line_pair(self.away_line_id, self.away_pair_id)
+        base = [p for p in base if not p.is_goalie]
         # Candidate pool: all skaters not already on-ice
-        candidates = [p for p in team.roster if p.position != 'G' and p not in base]
-        extra = max(candidates, key=lambda p: p.creation + p.conversion) if candidates else []
+        candidates = [p for p in team.roster if not p.is_goalie and p not in base]
+        extra = max(candidates, key=_OFFENSE_KEY) if candidates else []
         if extra:
             unit = base + [extra]
         else:
@@ -1359,30 +1689,29 @@ class Game:
     
     def calculate_event_rates(self) -> Dict[str, float]:
         """Calculate all event rates for current on-ice situation."""
+        home_shot, away_shot, home_pen, away_pen = self._event_rates()
+        return {
+            'home_shot': home_shot,
+            'away_shot': away_shot,
+            'home_penalty': home_pen,
+            'away_penalty': away_pen
+        }
+
+    def _event_rates(self) -> Tuple[float, float, float, float]:
+        """Return (home_shot, away_shot, home_penalty, away_penalty) rates per second.
+
+        Scalar core of calculate_event_rates; the shift loop uses it directly to skip
+        building and indexing a dict every shift.
+        """
         # Use cached on-ice sums from shift start
         home_creation = self._home_creation_sum
         home_suppression = self._home_suppression_sum
         away_creation = self._away_creation_sum
         away_suppression = self._away_suppression_sum
         
-        # Select shot rate baselines based on current manpower (supports stacks, pulled goalie)
-        active_home = sum(1 for p in self.home_penalties if p['segment_end'] > self.current_time)
-        active_away = sum(1 for p in self.away_penalties if p['segment_end'] > self.current_time)
-        n_home = max(3, 5 - active_home)
-        n_away = max(3, 5 - active_away)
-        # Pulled goalie overrides (late game): 6v5 or 5v6, and 6v4/4v6 when penalties
-        if self.pulled_team == 'home':
-            n_home = 6
-        elif self.pulled_team == 'away':
-            n_away = 6
-
-        # Get shot rate baselines for both teams based on n_home:n_away situation
-        situation = (n_home, n_away)
-        if situation in SHOT_RATE_BASELINES:
-            base_home_shots, base_away_shots = SHOT_RATE_BASELINES[situation]
-        else:
-            # Fallback to 5v5 if situation not covered
-            base_home_shots, base_away_shots = SHOT_RATE_BASELINES[(5, 5)]
+        # Shot rate baselines for the current n_home:n_away manpower (supports stacks and
+        # pulled goalie: 6v5/5v6, and 6v4/4v6 when penalties); falls back to 5v5 if not covered
+        base_home_shots, base_away_shots = SHOT_RATE_LUT[self._manpower_index()]
 
         # Apply home-ice advantage to shot creation: multiply home team's baseline with team-specific multiplier
         base_home_shots *= self.home_team.hfa_shot_creation_mult
@@ -1393,19 +1722,9 @@ class Game:
         lambda_home_shot = max(TINY, base_home_shots + SHOT_RATE_SCALE * home_creation - SHOT_RATE_SCALE * away_suppression)
         lambda_away_shot = max(TINY, base_away_shots + SHOT_RATE_SCALE * away_creation - SHOT_RATE_SCALE * home_suppression)
         
-        # Penalty rates: base 6 per team per 60 minutes, modulated by on-ice discipline
-        # Use normalized exponential weights so league average stays centered at 1.
-        base_pen = PEN_BASE
-        # Apply home-ice advantage to penalty rate: multiply home team's penalty draw rate
-        lambda_home_pen = base_pen * self._home_pen_mult * HFA_PENALTY_MULT
-        lambda_away_pen = base_pen * self._away_pen_mult
-        
-        return {
-            'home_shot': lambda_home_shot,
-            'away_shot': lambda_away_shot,
-            'home_penalty': lambda_home_pen,
-            'away_penalty': lambda_away_pen
-        }
+        # Penalty rates, modulated by on-ice discipline (normalized exponential weights keep the
+        # league average centered at 1), are precomputed by _rebuild_on_ice_caches
+        return lambda_home_shot, lambda_away_shot, self._home_pen_rate, self._away_pen_rate
     
     def _get_xg_baseline(self, for_team: str) -> float:
         """Get xG baseline for current situation for the specified team.
@@ -1416,27 +1735,10 @@ class Game:
         Returns:
             Baseline xG value for the current manpower situation
         """
-        active_home = sum(1 for p in self.home_penalties if p['segment_end'] > self.current_time)
-        active_away = sum(1 for p in self.away_penalties if p['segment_end'] > self.current_time)
-        n_home = max(3, 5 - active_home)
-        n_away = max(3, 5 - active_away)
-        
-        # Pulled goalie overrides
-        if self.pulled_team == 'home':
-            n_home = 6
-        elif self.pulled_team == 'away':
-            n_away = 6
-        
-        # Get baseline xG based on situation
-        situation = (n_home, n_away)
-        if situation in XG_BASELINES:
-            xg_home, xg_away = XG_BASELINES[situation]
-            base_xg = xg_home if for_team == 'home' else xg_away
-        else:
-            # Fallback to 5v5 if situation not covered
-            base_xg = XG_BASELINES[(5, 5)][0] if for_team == 'home' else XG_BASELINES[(5, 5)][1]
-        
-        return base_xg
+        # Get baseline xG based on manpower situation
+        # (falls back to 5v5 if situation not covered)
+        xg_home, xg_away = XG_LUT[self._manpower_index()]
+        return xg_home if for_team == 'home' else xg_away
     
     def _process_shot(self, team: str) -> bool:
         """Process a shot event: calculate xG and determine if it becomes a goal.
@@ -1447,8 +1749,6 @@ class Game:
         Returns:
             True if shot becomes a goal, False otherwise
         """
-        import random
-        
         # Get baseline xG for this situation
         base_xg = self._get_xg_baseline(team)
         
@@ -1485,31 +1785,24 @@ class Game:
         is_goal = random.random() < xg
         
         # Record shot event with xG value
-        h_oi, a_oi = self._current_on_ice_names()
         context = 'home_pp_shot' if (team == 'home' and self.penalized_team == 'away') else \
                   ('away_pp_shot' if (team == 'away' and self.penalized_team == 'home') else 'even')
         
-        # Add xG to event tuple (extend event format)
-        self.events.append((
-            self.current_time, 
-            'shot', 
-            f'{team.capitalize()} team shot (xG: {xg:.3f})', 
-            self.home_score, 
-            self.away_score, 
-            context, 
-            h_oi, 
-            a_oi,
-            xg  # Add xG as 9th element
-        ))
+        # Add xG to event tuple (extend event format: xG as 9th element)
+        self._log_event('shot', f'{team.capitalize()} team shot (xG: {xg:.3f})', context, xg)
         
         return is_goal
     
-    def simulate_shift(self) -> None:
-        """Simulate one shift using Poisson events."""
+    def simulate_shift(self) -> bool:
+        """Simulate one shift using Poisson events; return True if it ended in a goal."""
         # Late-game pulled-goalie strategy per spec using period 3 and period_remaining ≤ 120
         # Compute precise remaining time in current period using Period.end_time.
+        # current_time is fixed until the shift resolves, so read it once.
+        t0 = self.current_time
         if self.current_period is not None:
-            period_remaining = max(0.0, self.current_period.end_time - self.current_time)
+            period_remaining = self.current_period.end_time - t0
+            if period_remaining < 0.0:
+                period_remaining = 0.0
         else:
             period_remaining = 0.0
         if (self.current_period and self.current_period.period_number == 3) and period_remaining <= 150.0:
@@ -1518,33 +1811,30 @@ class Game:
                 if diff < 0 and abs(diff) <= 2:
                     self.pulled_team = 'home'
                     # Log goalie pulled
-                    h_oi, a_oi = self._current_on_ice_names()
-                    self.events.append((self.current_time, 'goalie_pulled', 'Home pulls the goalie for an extra attacker', self.home_score, self.away_score, 'home_pulled', h_oi, a_oi))
+                    self._log_event('goalie_pulled', 'Home pulls the goalie for an extra attacker', 'home_pulled')
                 elif diff > 0 and abs(diff) <= 2:
                     self.pulled_team = 'away'
                     # Log goalie pulled
-                    h_oi, a_oi = self._current_on_ice_names()
-                    self.events.append((self.current_time, 'goalie_pulled', 'Away pulls the goalie for an extra attacker', self.home_score, self.away_score, 'away_pulled', h_oi, a_oi))
+                    self._log_event('goalie_pulled', 'Away pulls the goalie for an extra attacker', 'away_pulled')
                 if self.pulled_team is not None:
                     self._rebuild_on_ice_caches()
         
-        rates = self.calculate_event_rates()
+        home_shot_rate, away_shot_rate, home_pen_rate, away_pen_rate = self._event_rates()
         # Only stochastic (shots/penalties) compete with deterministic line-change/period boundaries
-        total_rate = rates['home_shot'] + rates['away_shot'] + rates['home_penalty'] + rates['away_penalty']
+        total_rate = home_shot_rate + away_shot_rate + home_pen_rate + away_pen_rate
         
         if total_rate <= 0:
-            return
+            return False
         
         # Sample next stochastic event time (shots/penalties)
-        import random
         delta_event = random.expovariate(total_rate) if total_rate > 0 else float('inf')
         
         # Deterministic boundaries: line changes (uniform windows) and period end
         # Compute remaining times from absolute deadlines
-        rem_hf = max(0.0, self.home_fwd_deadline - self.current_time)
-        rem_hd = max(0.0, self.home_def_deadline - self.current_time)
-        rem_af = max(0.0, self.away_fwd_deadline - self.current_time)
-        rem_ad = max(0.0, self.away_def_deadline - self.current_time)
+        rem_hf = max(0.0, self.home_fwd_deadline - t0)
+        rem_hd = max(0.0, self.home_def_deadline - t0)
+        rem_af = max(0.0, self.away_fwd_deadline - t0)
+        rem_ad = max(0.0, self.away_def_deadline - t0)
         boundaries = [
             ('home_forward', rem_hf),
             ('home_defense', rem_hd),
@@ -1553,51 +1843,46 @@ class Game:
             ('period_end', period_remaining)
         ]
         # Add earliest penalty expiration boundary for each side if active
-        future_home = [p['segment_end'] for p in self.home_penalties if p['segment_end'] > self.current_time]
-        future_away = [p['segment_end'] for p in self.away_penalties if p['segment_end'] > self.current_time]
+        future_home = self._advance_expiries('home')
+        future_away = self._advance_expiries('away')
         if future_home:
-            boundaries.append(('penalty_end_home', min(future_home) - self.current_time))
+            boundaries.append(('penalty_end_home', future_home[0][0] - t0))
         if future_away:
-            boundaries.append(('penalty_end_away', min(future_away) - self.current_time))
-        boundary_kind, boundary_time = min(boundaries, key=lambda x: x[1])
+            boundaries.append(('penalty_end_away', future_away[0][0] - t0))
+        boundary_kind, boundary_time = min(boundaries, key=itemgetter(1))
         
         if delta_event < boundary_time:
             # Stochastic event occurs first: end shift
-            self.current_time += delta_event
+            self.current_time = t0 + delta_event
             
-            # Choose which event
-            event_choice = random.choices(
-                ['home_shot','away_shot','home_penalty','away_penalty'],
-                weights=[rates['home_shot'],rates['away_shot'],rates['home_penalty'],rates['away_penalty']],
-                k=1
-            )[0]
+            # Choose which event by walking the cumulative rates. This consumes one
+            # random() scaled by total_rate and bisects exactly like random.choices(k=1),
+            # without building the population and cumulative-weight lists per shift.
+            u = random.random() * total_rate
+            cum = home_shot_rate
+            if u < cum:
+                event_choice = 'home_shot'
+            else:
+                cum += away_shot_rate
+                if u < cum:
+                    event_choice = 'away_shot'
+                else:
+                    cum += home_pen_rate
+                    event_choice = 'home_penalty' if u < cum else 'away_penalty'
             
-            self._handle_event(event_choice)
+            # Shot handlers report whether the shot scored; penalty handlers return None
+            return bool(self._EVENT_DISPATCH[event_choice](self))
         else:
             # Boundary occurs first; clamp to period end to avoid any drift beyond 3600 in regulation
-            if self.current_period is not None:
-                boundary_time = min(boundary_time, max(0.0, self.current_period.end_time - self.current_time))
-            self.current_time += boundary_time
-            if boundary_kind == 'period_end':
-                # Let period logic handle the end; do not rotate here
-                return
-            if boundary_kind == 'penalty_end_home':
-                self._end_one_penalty('home')
-                self._handle_line_change()
-                return
-            if boundary_kind == 'penalty_end_away':
-                self._end_one_penalty('away')
-                self._handle_line_change()
-                return
-            # Apply specific line change and start a new shift (resamples clocks)
-            if boundary_kind == 'home_forward':
-                self._handle_line_change(team='home', unit='forward')
-            elif boundary_kind == 'home_defense':
-                self._handle_line_change(team='home', unit='defense')
-            elif boundary_kind == 'away_forward':
-                self._handle_line_change(team='away', unit='forward')
-            elif boundary_kind == 'away_defense':
-                self._handle_line_change(team='away', unit='defense')
+            if self.current_period is not None and boundary_time > period_remaining:
+                boundary_time = period_remaining
+            self.current_time = t0 + boundary_time
+            # Penalty expiries and line changes start a new shift (resamples clocks);
+            # period_end has no handler and is left to the period logic
+            handler = self._BOUNDARY_DISPATCH.get(boundary_kind)
+            if handler is not None:
+                handler(self)
+            return False
     
     def _get_manpower_state(self) -> Tuple[int, int]:
         """Get current manpower state (home_skaters, away_skaters).
@@ -1605,10 +1890,10 @@ class Game:
         Returns:
             Tuple of (home_skaters, away_skaters), accounting for penalties and pulled goalie
         """
-        active_home = sum(1 for p in self.home_penalties if p['segment_end'] > self.current_time)
-        active_away = sum(1 for p in self.away_penalties if p['segment_end'] > self.current_time)
-        n_home = max(3, 5 - active_home)
-        n_away = max(3, 5 - active_away)
+        active_home = self._active_penalty_count('home')
+        active_away = self._active_penalty_count('away')
+        n_home = 3 if active_home >= 2 else 5 - active_home
+        n_away = 3 if active_away >= 2 else 5 - active_away
         
         # Pulled goalie overrides
         if self.pulled_team == 'home':
@@ -1618,124 +1903,162 @@ class Game:
         
         return n_home, n_away
     
-    def _handle_event(self, event_type: str) -> None:
-        """Handle a specific event type."""
-        if event_type == 'home_shot':
-            # Process shot: calculate xG and determine if it becomes a goal
-            is_goal = self._process_shot('home')
-            
-            if is_goal:
-                # Shot becomes a goal
-                self.home_score += 1
-                context = 'home_pp_goal' if self.penalized_team == 'away' else ('away_pp_against' if self.penalized_team == 'home' else 'even')
-                h_oi, a_oi = self._current_on_ice_names()
-                # Get manpower state and sample assists
-                n_home, n_away = self._get_manpower_state()
-                assists = sample_assists(n_home, n_away)
-                self.events.append((self.current_time, 'goal', f'Home team scores! {self.home_score}-{self.away_score}', self.home_score, self.away_score, context, h_oi, a_oi, assists))
-                # If away was shorthanded, release oldest away minor (oldest-minor rule)
-                if self.penalized_team == 'away':
-                    self._end_one_penalty('away')
-                # If away had pulled and conceded EN against them, revert to normal
-                if self.pulled_team == 'away' and self.penalized_team is None:
-                    self.pulled_team = None
-                    h_oi, a_oi = self._current_on_ice_names()
-                    self.events.append((self.current_time, 'goalie_in', 'Away goalie returns after empty-net against', self.home_score, self.away_score, 'away_in', h_oi, a_oi))
-                    self._rebuild_on_ice_caches()
-                # If home had pulled and just tied the game, revert to normal
-                if self.pulled_team == 'home' and self.home_score == self.away_score:
-                    self.pulled_team = None
-                    h_oi, a_oi = self._current_on_ice_names()
-                    self.events.append((self.current_time, 'goalie_in', 'Home goalie returns after tying the game', self.home_score, self.away_score, 'home_in', h_oi, a_oi))
-                    self._rebuild_on_ice_caches()
-                self._handle_line_change()  # New shift after goal
-            
-        elif event_type == 'away_shot':
-            # Process shot: calculate xG and determine if it becomes a goal
-            is_goal = self._process_shot('away')
-            
-            if is_goal:
-                # Shot becomes a goal
-                self.away_score += 1
-                context = 'away_pp_goal' if self.penalized_team == 'home' else ('home_pp_against' if self.penalized_team == 'away' else 'even')
-                h_oi, a_oi = self._current_on_ice_names()
-                # Get manpower state and sample assists
-                n_home, n_away = self._get_manpower_state()
-                assists = sample_assists(n_away, n_home)  # Note: scoring team is away, so n_away comes first
-                self.events.append((self.current_time, 'goal', f'Away team scores! {self.home_score}-{self.away_score}', self.home_score, self.away_score, context, h_oi, a_oi, assists))
-                # If home was shorthanded, release oldest home minor
-                if self.penalized_team == 'home':
-                    self._end_one_penalty('home')
-                # If home had pulled and conceded EN against them, revert to normal
-                if self.pulled_team == 'home' and self.penalized_team is None:
-                    self.pulled_team = None
-                    h_oi, a_oi = self._current_on_ice_names()
-                    self.events.append((self.current_time, 'goalie_in', 'Home goalie returns after empty-net against', self.home_score, self.away_score, 'home_in', h_oi, a_oi))
-                    self._rebuild_on_ice_caches()
-                # If away had pulled and just tied the game, revert to normal
-                if self.pulled_team == 'away' and self.home_score == self.away_score:
-                    self.pulled_team = None
-                    h_oi, a_oi = self._current_on_ice_names()
-                    self.events.append((self.current_time, 'goalie_in', 'Away goalie returns after tying the game', self.home_score, self.away_score, 'away_in', h_oi, a_oi))
-                    self._rebuild_on_ice_caches()
-                self._handle_line_change()  # New shift after goal
-            
-        elif event_type == 'home_penalty':
-            # Simplified penalty handling
-            h_oi, a_oi = self._current_on_ice_names()
-            # Enter power play state before changing lines so special teams deploy
-            # This will create the penalty entry with type info
-            self._enter_power_play('home')
-            # Get the penalty type and minutes from the most recent penalty
-            if self.home_penalties:
-                latest_penalty = self.home_penalties[-1]
-                ptype = latest_penalty['type']
-                # Convert penalty type to minutes
-                if ptype == 'minor':
-                    penalty_minutes = 2
-                elif ptype == 'double_minor':
-                    penalty_minutes = 4
-                elif ptype == 'major':
-                    penalty_minutes = 5
-                else:
-                    penalty_minutes = 2  # default
+    def _manpower_index(self) -> int:
+        """Index of the current manpower state into SHOT_RATE_LUT / XG_LUT."""
+        n_home, n_away = self._get_manpower_state()
+        return (n_home - 3) * 4 + (n_away - 3)
+    
+    def _on_home_shot(self) -> bool:
+        """Resolve a home shot and, if it scores, the goal aftermath. Returns whether it scored."""
+        # Process shot: calculate xG and determine if it becomes a goal
+        is_goal = self._process_shot('home')
+
+        if is_goal:
+            # Shot becomes a goal
+            self.home_score += 1
+            context = 'home_pp_goal' if self.penalized_team == 'away' else ('away_pp_against' if self.penalized_team == 'home' else 'even')
+            # Get manpower state and sample assists
+            n_home, n_away = self._get_manpower_state()
+            assists = sample_assists(n_home, n_away)
+            self._log_event('goal', f'Home team scores! {self.home_score}-{self.away_score}', context, assists)
+            # If away was shorthanded, release oldest away minor (oldest-minor rule)
+            if self.penalized_team == 'away':
+                self._end_one_penalty('away')
+            # If away had pulled and conceded EN against them, revert to normal
+            if self.pulled_team == 'away' and self.penalized_team is None:
+                self.pulled_team = None
+                self._log_event('goalie_in', 'Away goalie returns after empty-net against', 'away_in')
+                self._rebuild_on_ice_caches()
+            # If home had pulled and just tied the game, revert to normal
+            if self.pulled_team == 'home' and self.home_score == self.away_score:
+                self.pulled_team = None
+                self._log_event('goalie_in', 'Home goalie returns after tying the game', 'home_in')
+                self._rebuild_on_ice_caches()
+            self._handle_line_change()  # New shift after goal
+        return is_goal
+    
+    def _on_away_shot(self) -> bool:
+        """Resolve an away shot and, if it scores, the goal aftermath. Returns whether it scored."""
+        # Process shot: calculate xG and determine if it becomes a goal
+        is_goal = self._process_shot('away')
+
+        if is_goal:
+            # Shot becomes a goal
+            self.away_score += 1
+            context = 'away_pp_goal' if self.penalized_team == 'home' else ('home_pp_against' if self.penalized_team == 'away' else 'even')
+            # Get manpower state and sample assists
+            n_home, n_away = self._get_manpower_state()
+            assists = sample_assists(n_away, n_home)  # Note: scoring team is away, so n_away comes first
+            self._log_event('goal', f'Away team scores! {self.home_score}-{self.away_score}', context, assists)
+            # If home was shorthanded, release oldest home minor
+            if self.penalized_team == 'home':
+                self._end_one_penalty('home')
+            # If home had pulled and conceded EN against them, revert to normal
+            if self.pulled_team == 'home' and self.penalized_team is None:
+                self.pulled_team = None
+                self._log_event('goalie_in', 'Home goalie returns after empty-net against', 'home_in')
+                self._rebuild_on_ice_caches()
+            # If away had pulled and just tied the game, revert to normal
+            if self.pulled_team == 'away' and self.home_score == self.away_score:
+                self.pulled_team = None
+                self._log_event('goalie_in', 'Away goalie returns after tying the game', 'away_in')
+                self._rebuild_on_ice_caches()
+            self._handle_line_change()  # New shift after goal
+        return is_goal
+    
+    def _on_home_penalty(self) -> None:
+        """Assess a home penalty and deploy special teams."""
+        # Simplified penalty handling
+        # Enter power play state before changing lines so special teams deploy
+        # This will create the penalty entry with type info
+        self._enter_power_play('home')
+        # Get the penalty type and minutes from the most recent penalty
+        if self.home_penalties:
+            latest_penalty = self.home_penalties[-1]
+            ptype = latest_penalty['type']
+            # Convert penalty type to minutes
+            if ptype == 'minor':
+                penalty_minutes = 2
+            elif ptype == 'double_minor':
+                penalty_minutes = 4
+            elif ptype == 'major':
+                penalty_minutes = 5
             else:
-                penalty_minutes = 2  # fallback
-            self.events.append((self.current_time, 'penalty', 'Home team penalty', self.home_score, self.away_score, 'home_penalty', h_oi, a_oi, penalty_minutes))
-            self._handle_line_change()
-            
-        elif event_type == 'away_penalty':
-            h_oi, a_oi = self._current_on_ice_names()
-            # Enter power play state before changing lines so special teams deploy
-            self._enter_power_play('away')
-            # Get the penalty type and minutes from the most recent penalty
-            if self.away_penalties:
-                latest_penalty = self.away_penalties[-1]
-                ptype = latest_penalty['type']
-                # Convert penalty type to minutes
-                if ptype == 'minor':
-                    penalty_minutes = 2
-                elif ptype == 'double_minor':
-                    penalty_minutes = 4
-                elif ptype == 'major':
-                    penalty_minutes = 5
-                else:
-                    penalty_minutes = 2  # default
+                penalty_minutes = 2  # default
+        else:
+            penalty_minutes = 2  # fallback
+        self._log_event('penalty', 'Home team penalty', 'home_penalty', penalty_minutes)
+        self._handle_line_change()
+    
+    def _on_away_penalty(self) -> None:
+        """Assess an away penalty and deploy special teams."""
+        # Enter power play state before changing lines so special teams deploy
+        self._enter_power_play('away')
+        # Get the penalty type and minutes from the most recent penalty
+        if self.away_penalties:
+            latest_penalty = self.away_penalties[-1]
+            ptype = latest_penalty['type']
+            # Convert penalty type to minutes
+            if ptype == 'minor':
+                penalty_minutes = 2
+            elif ptype == 'double_minor':
+                penalty_minutes = 4
+            elif ptype == 'major':
+                penalty_minutes = 5
             else:
-                penalty_minutes = 2  # fallback
-            self.events.append((self.current_time, 'penalty', 'Away team penalty', self.home_score, self.away_score, 'away_penalty', h_oi, a_oi, penalty_minutes))
-            self._handle_line_change()
-            
-        elif event_type in ['home_line_change', 'away_line_change', 'home_def_change', 'away_def_change']:
-            # Team-specific line change events
-            if event_type == 'home_line_change':
-                self._handle_line_change(team='home', unit='forward')
-            elif event_type == 'away_line_change':
-                self._handle_line_change(team='away', unit='forward')
-            elif event_type == 'home_def_change':
-                self._handle_line_change(team='home', unit='defense')
-            elif event_type == 'away_def_change':
-                self._handle_line_change(team='away', unit='defense')
+                penalty_minutes = 2  # default
+        else:
+            penalty_minutes = 2  # fallback
+        self._log_event('penalty', 'Away team penalty', 'away_penalty', penalty_minutes)
+        self._handle_line_change()
+    
+    def _on_home_line_change(self) -> None:
+        self._handle_line_change(team='home', unit='forward')
+    
+    def _on_away_line_change(self) -> None:
+        self._handle_line_change(team='away', unit='forward')
+    
+    def _on_home_def_change(self) -> None:
+        self._handle_line_change(team='home', unit='defense')
+    
+    def _on_away_def_change(self) -> None:
+        self._handle_line_change(team='away', unit='defense')
+    
+    def _on_home_penalty_end(self) -> None:
+        self._end_one_penalty('home')
+        self._handle_line_change()
+    
+    def _on_away_penalty_end(self) -> None:
+        self._end_one_penalty('away')
+        self._handle_line_change()
+    
+    # Event type -> handler, looked up once per event instead of an if/elif cascade
+    _EVENT_DISPATCH = {
+        'home_shot': _on_home_shot,
+        'away_shot': _on_away_shot,
+        'home_penalty': _on_home_penalty,
+        'away_penalty': _on_away_penalty,
+        'home_line_change': _on_home_line_change,
+        'away_line_change': _on_away_line_change,
+        'home_def_change': _on_home_def_change,
+        'away_def_change': _on_away_def_change,
+    }
+    
+    # Deterministic shift boundary -> handler, keyed by the boundary kinds from simulate_shift
+    _BOUNDARY_DISPATCH = {
+        'home_forward': _on_home_line_change,
+        'home_defense': _on_home_def_change,
+        'away_forward': _on_away_line_change,
+        'away_defense': _on_away_def_change,
+        'penalty_end_home': _on_home_penalty_end,
+        'penalty_end_away': _on_away_penalty_end,
+    }
+    
+    def _handle_event(self, event_type: str) -> None:
+        """Handle a specific event type; unknown types are ignored."""
+        handler = self._EVENT_DISPATCH.get(event_type)
+        if handler is not None:
+            handler(self)
     
     def _handle_line_change(self, team: Optional[str] = None, unit: Optional[str] = None) -> None:
         """Apply a line change and update on-ice units.
@@ -1752,8 +2075,7 @@ class Game:
             self._rotate_defense('away')
             self._rebuild_on_ice_caches()
             self._resample_clocks()
-            h_oi, a_oi = self._current_on_ice_names()
-            self.events.append((self.current_time, 'line_change', 'Both teams change forwards and defense', self.home_score, self.away_score, '', h_oi, a_oi))
+            self._log_event('line_change', 'Both teams change forwards and defense')
             return
 
         # Team-specific change
@@ -1763,12 +2085,9 @@ class Game:
             self._rotate_defense(team)
         # Rebuild on-ice and resample only the changed unit's clock
         self._rebuild_on_ice_caches()
-        unit_key = f"{team}_{'forward' if unit=='forward' else 'defense'}"
+        unit_key, description = _LINE_CHANGE_LABELS[(team, unit)]
         self._resample_clocks(unit_key)
-        label_team = 'Home' if team == 'home' else 'Away'
-        label_unit = 'forward line' if unit == 'forward' else ('defensive pair' if unit == 'defense' else 'lines and pairs')
-        h_oi, a_oi = self._current_on_ice_names()
-        self.events.append((self.current_time, 'line_change', f'{label_team} {label_unit} change', self.home_score, self.away_score, '', h_oi, a_oi))
+        self._log_event('line_change', description)
     
     def simulate_game(self) -> Dict:
         """Simulate the entire game."""
@@ -1776,7 +2095,7 @@ class Game:
         
         # Simulate 3 regulation periods
         for period_num in range(1, 4):
-            period = Period(period_num, 1200.0, is_overtime=False)  # 20 minutes = 1200 seconds
+            period = Period(period_num, PERIOD_SECONDS, is_overtime=False)
             self._simulate_period(period)
         
         # Check if game is tied after regulation
@@ -1797,8 +2116,7 @@ class Game:
         # Stagger start slightly to avoid same-timestamp with prior end
         start_t = self.current_time + (1e-6 if self.events and self.events[-1][1] == 'period_end' else 0.0)
         period.start_period(start_t)
-        h_oi, a_oi = self._current_on_ice_names()
-        self.events.append((start_t, 'period_start', f'Start of Period {period.period_number}', self.home_score, self.away_score, '', h_oi, a_oi))
+        self.events.append((start_t, 'period_start', f'Start of Period {period.period_number}', self.home_score, self.away_score, '', self._home_on_ice_names, self._away_on_ice_names, None))
         
         # Simulate shifts until period ends
         while not period.is_finished(self.current_time):
@@ -1806,31 +2124,28 @@ class Game:
         
         # End the period
         period.end_period(self.current_time)
-        h_oi, a_oi = self._current_on_ice_names()
-        self.events.append((self.current_time, 'period_end', f'End of Period {period.period_number}', self.home_score, self.away_score, '', h_oi, a_oi))
+        self._log_event('period_end', f'End of Period {period.period_number}')
     
     def _simulate_overtime(self) -> None:
         """Simulate sudden-death overtime with repeated periods until a goal is scored."""
         ot_idx = 1
         while self.home_score == self.away_score:
             # Each OT period is 20 minutes sudden-death
-            overtime = Period(3 + ot_idx, 1200.0, is_overtime=True)
+            overtime = Period(3 + ot_idx, PERIOD_SECONDS, is_overtime=True)
             self.current_period = overtime
             overtime.start_period(self.current_time)
-            h_oi, a_oi = self._current_on_ice_names()
-            self.events.append((self.current_time, 'overtime_start', f'Overtime {ot_idx} begins - sudden death', self.home_score, self.away_score, '', h_oi, a_oi))
+            self._log_event('overtime_start', f'Overtime {ot_idx} begins - sudden death')
+            self.went_ot = True
 
             while not overtime.is_finished(self.current_time):
-                self.simulate_shift()
-                if self.home_score != self.away_score:
-                    h_oi, a_oi = self._current_on_ice_names()
-                    self.events.append((self.current_time, 'overtime_goal', 'Overtime goal - game over!', self.home_score, self.away_score, '', h_oi, a_oi))
+                # Overtime starts tied, so the first goal ends it
+                if self.simulate_shift():
+                    self._log_event('overtime_goal', 'Overtime goal - game over!')
                     return
 
             # Period ended without a goal; mark end and loop to another OT period
             overtime.end_period(self.current_time)
-            h_oi, a_oi = self._current_on_ice_names()
-            self.events.append((self.current_time, 'period_end', f'End of Overtime {ot_idx}', self.home_score, self.away_score, '', h_oi, a_oi))
+            self._log_event('period_end', f'End of Overtime {ot_idx}')
             ot_idx += 1
     
     def _get_line_type(self, team: str, line_id: int) -> str:
@@ -1883,13 +2198,13 @@ class Game:
         # Process events chronologically
         for i, event in enumerate(self.events):
             event_time = event[0]
-            event_type = event[1] if len(event) > 1 else ''
-            tag = event[5] if len(event) > 5 else ''
+            event_type = event[1]
+            tag = event[5]
             
             # Update line/pair IDs based on line_change events
             if event_type == 'line_change':
                 # Parse the description to determine which team/unit changed
-                desc = str(event[2]) if len(event) > 2 else ''
+                desc = str(event[2])
                 if 'Home forward line' in desc or ('Home' in desc and 'forward' in desc.lower() and 'defense' not in desc.lower()):
                     # Home forward line change
                     current_home_line_id = (current_home_line_id % len(self.home_team.lines)) + 1
@@ -2022,31 +2337,29 @@ class Game:
                 # Shot event - check which team
                 if 'Home' in str(event[2]) or 'home' in tag.lower():
                     matchup_stats[current_matchup]['home_shots'] += 1
-                    if len(event) > 8:
-                        xg = event[8]
-                        matchup_stats[current_matchup]['home_xg'] += xg
-                        matchup_stats[current_matchup]['home_max_xg'] = max(
-                            matchup_stats[current_matchup]['home_max_xg'], xg
-                        )
+                    xg = event[8]
+                    matchup_stats[current_matchup]['home_xg'] += xg
+                    matchup_stats[current_matchup]['home_max_xg'] = max(
+                        matchup_stats[current_matchup]['home_max_xg'], xg
+                    )
                 elif 'Away' in str(event[2]) or 'away' in tag.lower():
                     matchup_stats[current_matchup]['away_shots'] += 1
-                    if len(event) > 8:
-                        xg = event[8]
-                        matchup_stats[current_matchup]['away_xg'] += xg
-                        matchup_stats[current_matchup]['away_max_xg'] = max(
-                            matchup_stats[current_matchup]['away_max_xg'], xg
-                        )
+                    xg = event[8]
+                    matchup_stats[current_matchup]['away_xg'] += xg
+                    matchup_stats[current_matchup]['away_max_xg'] = max(
+                        matchup_stats[current_matchup]['away_max_xg'], xg
+                    )
             
             elif event_type == 'goal':
                 # Goal event - check which team scored
-                home_score = event[3] if len(event) > 3 else 0
-                away_score = event[4] if len(event) > 4 else 0
-                # Get assists from event (9th element, if present)
-                assists = event[8] if len(event) > 8 else 0
+                home_score = event[3]
+                away_score = event[4]
+                # Assists are the goal's detail field
+                assists = event[8]
                 # Determine which team scored by comparing to previous scores
                 if i > 0:
-                    prev_home = self.events[i-1][3] if len(self.events[i-1]) > 3 else 0
-                    prev_away = self.events[i-1][4] if len(self.events[i-1]) > 4 else 0
+                    prev_home = self.events[i-1][3]
+                    prev_away = self.events[i-1][4]
                     if home_score > prev_home:
                         matchup_stats[current_matchup]['home_goals'] += 1
                         matchup_stats[current_matchup]['home_assists'] += assists
@@ -2056,7 +2369,7 @@ class Game:
             
             elif event_type == 'penalty':
                 # Penalty event - track penalty minutes assessed
-                penalty_minutes = event[8] if len(event) > 8 else 2  # Default to 2 if not found
+                penalty_minutes = event[8]
                 
                 if 'home_penalty' in tag or 'Home' in str(event[2]):
                     matchup_stats[current_matchup]['home_penalties_taken'] += 1
@@ -2075,7 +2388,7 @@ class Game:
             prev_away_goalie = current_away_goalie
         
         # Check if game went to OT
-        went_ot = any(e[1] == 'overtime_start' for e in self.events)
+        went_ot = self.went_ot
         
         # Add remaining time from last event to end of game
         # Game ends at 3600 seconds (3 periods of 1200s each) for non-OT games
@@ -32,31 +32,43 @@ def _fake_unique_name(fake: Faker, seen: set[str], male: bool = False) -> str:
             return candidate
         i += 1
 
+def _fake_unique_names(fake: Faker, n: int, male: bool = False) -> list[str]:
+    """Return n unique title-free names in one batch, deduplicated against a local set."""
+    seen: set[str] = set()
+    return [_fake_unique_name(fake, seen, male=male) for _ in range(n)]
+
+# Shared Faker instance; Faker.seed() reseeds the generator behind every instance
+_FAKER = None
+
+def _get_faker() -> Faker:
+    """Return the module's Faker instance, creating it on first use."""
+    global _FAKER
+    if _FAKER is None:
+        _FAKER = Faker()
+    return _FAKER
+
 # Central RNG for reproducibility across modules
 RNG = np.random.default_rng()
 
 def set_rng_seed(seed: int):
-    """Set the global RNG seed for reproducible simulations."""
+    """Seed both simulation RNGs for reproducible runs.
+
+    Seeds the module-level NumPy RNG and Python's random module, which draws player ratings,
+    coaches, draft shuffles, and all game events.
+    """
     global RNG
     RNG = np.random.default_rng(seed)
+    random.seed(seed)
 
 def create_coaches(n_teams: int) -> list[Coach]:
     """Create one coach per team with a random playstyle and unique title-free name."""
     playstyles = ["star-centric", "balanced", "complementary", "hyper-offensive", "hyper-defensive"]
-    fake = Faker()
+    fake = _get_faker()
     # tie Faker to Python RNG seeding for determinism
     Faker.seed(random.randrange(1_000_000_000))
-    coaches = []
-    seen: set[str] = set()
-    for _ in range(n_teams):
-        playstyle = random.choice(playstyles)
-        name = _fake_unique_name(fake, seen, male=False)
-        coaches.append(Coach(name, playstyle))
-    # reset unique tracker
-    try:
-        fake.unique.clear()
-    except Exception:
-        pass
+    # Faker draws from its own RNG, so batching names leaves the playstyle draws in place
+    names = _fake_unique_names(fake, n_teams, male=False)
+    coaches = [Coach(name, random.choice(playstyles)) for name in names]
     return coaches
 
 def create_players(n_teams: int, n_lines: int, n_pairs: int, n_goalies: int) -> list[Player]:
@@ -65,77 +77,72 @@ def create_players(n_teams: int, n_lines: int, n_pairs: int, n_goalies: int) ->
     Players receive male first names to avoid unexpected titles (e.g., DDS), and names are
     constructed as First Last to ensure no prefixes/suffixes.
     """
-    fake = Faker()
+    fake = _get_faker()
     # tie Faker to Python RNG seeding for determinism
     Faker.seed(random.randrange(1_000_000_000))
-    players = []
-    seen: set[str] = set()
     total_forwards = n_teams * n_lines * 3
     total_defenders = n_teams * n_pairs * 2
     total_goalies = n_teams * n_goalies
+    total_players = total_forwards + total_defenders + total_goalies
 
-    # Forwards
-    for _ in range(total_forwards):
-        pname = _fake_unique_name(fake, seen, male=True)
-        players.append(Player(
-            name = pname,
-            position = "F",
-            creation = random.gauss(0, 1),
-            conversion = random.gauss(0, 1),
-            suppression = random.gauss(0, 1),
-            prevention = random.gauss(0, 1),
-            goalkeeping = 0.0,
-            stamina = random.gauss(0, 1),
-            discipline = random.gauss(0, 1)
-        ))
-
-    # Defensemen
-    for _ in range(total_defenders):
-        pname = _fake_unique_name(fake, seen, male=True)
-        players.append(Player(
-            name = pname,
-            position = "D",
-            creation = random.gauss(0, 1),
-            conversion = random.gauss(0, 1),
-            suppression = random.gauss(0, 1),
-            prevention = random.gauss(0, 1),
-            goalkeeping = 0.0,
-            stamina = random.gauss(0, 1),
-            discipline = random.gauss(0, 1)
-        ))
-
-    # Goalies
-    for _ in range(total_goalies):
-        pname = _fake_unique_name(fake, seen, male=True)
-        players.append(Player(
-            name = pname,
-            position = "G",
-            creation = 0.0,
-            conversion = 0.0,
-            suppression = 0.0,
-            prevention = 0.0,
-            goalkeeping = random.gauss(0, 1),
-            stamina = random.gauss(0, 1),
-            discipline = random.gauss(0, 1)
-        ))
+    # Names come from Faker's own RNG, so drawing them all up front leaves the
+    # Python random stream used for ratings untouched
+    names = _fake_unique_names(fake, total_players, male=True)
+    positions = ["F"] * total_forwards + ["D"] * total_defenders + ["G"] * total_goalies
+    gauss = random.gauss
 
-    # reset unique tracker
-    try:
-        fake.unique.clear()
-    except Exception:
-        pass
+    # Ratings are drawn per player in the original order: forwards, defensemen, goalies
+    players = []
+    for pname, position in zip(names, positions):
+        if position == "G":
+            players.append(Player(
+                name = pname,
+                position = position,
+                creation = 0.0,
+                conversion = 0.0,
+                suppression = 0.0,
+                prevention = 0.0,
+                goalkeeping = gauss(0, 1),
+                stamina = gauss(0, 1),
+                discipline = gauss(0, 1)
+            ))
+        else:
+            players.append(Player(
+                name = pname,
+                position = position,
+                creation = gauss(0, 1),
+                conversion = gauss(0, 1),
+                suppression = gauss(0, 1),
+                prevention = gauss(0, 1),
+                goalkeeping = 0.0,
+                stamina = gauss(0, 1),
+                discipline = gauss(0, 1)
+            ))
 
     return players
 
+def _deal(pool: list[Player], k: int) -> list[Player]:
+    """Remove and return the last k players of pool, last first (same as k pool.pop() calls)."""
+    start = len(pool) - k
+    hand = pool[start:]
+    hand.reverse()
+    del pool[start:]
+    return hand
+
 def draft_teams(n_teams: int, players: list[Player], n_lines: int, n_pairs: int, n_goalies: int, coaches: list[Coach]) -> list[Team]:
     """Draft teams without replacement from the provided player pool."""
     # Collect teams
     teams = []
 
-    # Split by position
-    available_forwards = [p for p in players if p.position == "F"]
-    available_defenders = [p for p in players if p.position == "D"]
-    available_goalies = [p for p in players if p.position == "G"]
+    # Split by position in one pass
+    available_forwards = []
+    available_defenders = []
+    available_goalies = []
+    pools = {"F": available_forwards, "D": available_defenders, "G": available_goalies}
+    for p in players:
+        pool = pools.get(p.position)
+        if pool is not None:
+            pool.append(p)
 
     # Required counts per team
     required_forwards_per_team = n_lines * 3
@@ -185,10 +192,10 @@ def draft_teams(n_teams: int, players: list[Player], n_lines: int, n_pairs: int,
 
     # Build each team
     for i in range(n_teams):
-        # Sample without replacement
-        team_forwards = [available_forwards.pop() for _ in range(required_forwards_per_team)]
-        team_defenders = [available_defenders.pop() for _ in range(required_defenders_per_team)]
-        team_goalies = [available_goalies.pop() for _ in range(required_goalies_per_team)]
+        # Sample without replacement: deal each team the next block from the end of the shuffled pools
+        team_forwards = _deal(available_forwards, required_forwards_per_team)
+        team_defenders = _deal(available_defenders, required_defenders_per_team)
+        team_goalies = _deal(available_goalies, required_goalies_per_team)
         # Compose roster
         roster = team_forwards + team_defenders + team_goalies
         
@@ -4,7 +4,7 @@
 
 import csv
 import os
-import random
+from operator import itemgetter
 from functions import build_league, set_rng_seed, aggregate_team_box_scores, write_rank_csv
 from classes import League
 
@@ -14,8 +14,7 @@ from classes import League
 
 # Global seeding for reproducibility
 SEED = 2026
-set_rng_seed(SEED)   # NumPy RNG used inside simulation
-random.seed(SEED)    # Python RNG used for coaches, shuffles, etc.
+set_rng_seed(SEED)   # Seeds both the NumPy RNG and Python's random (coaches, shuffles, game events)
 
 # Ensure data directory exists
 DATA_DIR = 'data'
@@ -80,7 +79,7 @@ for team_name, s in standings.items():
         'GP': s['GP'], 'W': s['W'], 'L': s['L'], 'OTL': s['OTL'],
         'PTS': s['PTS'], 'GF': s['GF'], 'GA': s['GA'], 'GD': gd
     })
-rows.sort(key=lambda r: (r['PTS'], r['GD'], r['GF']), reverse=True)
+rows.sort(key=itemgetter('PTS', 'GD', 'GF'), reverse=True)
 with open(os.path.join(TEAMS_DIR, 'standings.csv'), 'w', newline='') as f:
     w = csv.DictWriter(f, fieldnames=['team','GP','W','L','OTL','PTS','GF','GA','GD'])
     w.writeheader()
@@ -121,7 +120,7 @@ print()
 # 13) Team attribute sums (teams)
 team_rows = league.get_teams()
 # Sort by total_sum desc, then creation_sum as tie-breaker
-team_rows.sort(key=lambda r: (r['total_sum'], r['creation_sum']), reverse=True)
+team_rows.sort(key=itemgetter('total_sum', 'creation_sum'), reverse=True)
 with open(os.path.join(TEAMS_DIR, 'teams.csv'), 'w', newline='') as f:
     w = csv.DictWriter(f, fieldnames=['team','coach','playstyle','conference','division','creation_sum','conversion_sum','suppression_sum','prevention_sum','goalkeeping_sum','stamina_sum','discipline_sum','total_sum','hfa_shot_creation_mult','hfa_xg_bonus','hfa_shot_suppression_mult','hfa_xg_suppression'])
     w.writeheader()
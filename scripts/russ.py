@@ -4,7 +4,7 @@
 
 import csv
 import os
-import random
+from operator import itemgetter
 from functions import build_league, set_rng_seed, aggregate_team_box_scores, write_rank_csv
 from classes import League
 
@@ -31,7 +31,6 @@ print()
 
 # Build league structure once (same for all seasons)
 # Set seed for league building
-random.seed(BASE_SEED)
 set_rng_seed(BASE_SEED)
 
 print(f"Building league structure with seed {BASE_SEED}...")
@@ -77,7 +76,7 @@ write_rank_csv(league, 'discipline', 'discipline', shared_players_dir, 50)
 
 # Write teams.csv (shared)
 team_rows = league.get_teams()
-team_rows.sort(key=lambda r: (r['total_sum'], r['creation_sum']), reverse=True)
+team_rows.sort(key=itemgetter('total_sum', 'creation_sum'), reverse=True)
 with open(os.path.join(shared_dir, 'teams.csv'), 'w', newline='') as f:
     w = csv.DictWriter(f, fieldnames=['team','coach','playstyle','conference','division','creation_sum','conversion_sum','suppression_sum','prevention_sum','goalkeeping_sum','stamina_sum','discipline_sum','total_sum','hfa_shot_creation_mult','hfa_xg_bonus','hfa_shot_suppression_mult','hfa_xg_suppression'])
     w.writeheader()
@@ -101,7 +100,6 @@ for season_num in range(1, NUM_SEASONS + 1):
     # Set different simulation seed for this season
     # Use BASE_SEED + season_num to ensure different randomness
     simulation_seed = BASE_SEED + (season_num * 1000)
-    random.seed(simulation_seed)
     set_rng_seed(simulation_seed)
     
     # Create season-specific directories for simulation-dependent data
@@ -135,7 +133,7 @@ for season_num in range(1, NUM_SEASONS + 1):
             'GP': s['GP'], 'W': s['W'], 'L': s['L'], 'OTL': s['OTL'],
             'PTS': s['PTS'], 'GF': s['GF'], 'GA': s['GA'], 'GD': gd
         })
-    rows.sort(key=lambda r: (r['PTS'], r['GD'], r['GF']), reverse=True)
+    rows.sort(key=itemgetter('PTS', 'GD', 'GF'), reverse=True)
     with open(os.path.join(season_teams_dir, 'standings.csv'), 'w', newline='') as f:
         w = csv.DictWriter(f, fieldnames=['team','GP','W','L','OTL','PTS','GF','GA','GD'])
         w.writeheader()